@@ -281,13 +281,13 @@ async def remove_theme_from_poem(
         theme_id = f"theme_{theme_name.lower().replace(' ', '_')}"
         
         if graph.graph.has_edge(poem_id, theme_id):
-            graph.graph.remove_edge(poem_id, theme_id)
-            
+            graph.remove_edge(poem_id, theme_id)
+
             # If no other poems use this theme, optionally remove the theme node
             # (You might want to make this configurable)
             if graph.graph.in_degree(theme_id) == 0:
-                graph.graph.remove_node(theme_id)
-            
+                graph.remove_entity(theme_id)
+
             graph.save_graph()
             return {"message": f"Removed theme '{theme_name}' from poem"}
         else:
@@ -358,15 +358,15 @@ async def merge_themes(
                 # Move all connections to target theme
                 for poem_id in list(graph.graph.predecessors(source_theme_id)):
                     # Remove old connection
-                    graph.graph.remove_edge(poem_id, source_theme_id)
-                    
+                    graph.remove_edge(poem_id, source_theme_id)
+
                     # Add new connection (if it doesn't exist)
                     if not graph.graph.has_edge(poem_id, target_theme_id):
                         graph.graph.add_edge(poem_id, target_theme_id, type="has_theme")
                         poems_updated += 1
-                
+
                 # Remove the old theme node
-                graph.graph.remove_node(source_theme_id)
+                graph.remove_entity(source_theme_id)
                 themes_removed += 1
         
         if poems_updated > 0 or themes_removed > 0:
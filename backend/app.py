@@ -168,7 +168,8 @@ async def generate_poem_for_route(
     personality = load_route_personality(route_id)
     
     # ==================== STEP 2: BUILD PROMPT FROM GRAPH ====================
-    prompt_builder = PromptBuilder(graph)
+    # Shared per-graph builder so its query cache survives across requests
+    prompt_builder = PromptBuilder.get(graph)
     
     prompt = prompt_builder.build_prompt_for_route(
         route_id=route_id,
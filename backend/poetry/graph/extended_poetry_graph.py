@@ -11,12 +11,18 @@ Designed for poets who work in free verse with heavy use of sound devices.
 
 import json
 import pickle
+from bisect import bisect_left, bisect_right
 from typing import List, Dict, Any, Optional, Set, Tuple
 from datetime import datetime
 from pathlib import Path
 import networkx as nx
 from collections import Counter, defaultdict
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class ExtendedPoetryGraph:
     """
@@ -48,9 +54,54 @@ class ExtendedPoetryGraph:
         """
         self.graph = nx.MultiDiGraph()
         self.graph_path = graph_path
-        
+
+        # Monotonic mutation counter used to invalidate derived caches
+        self._version = 0
+        # Cached shortest-path trees (source_id -> tree), valid while the
+        # graph version matches _path_trees_version
+        self._path_trees: Dict[str, Dict[str, List[str]]] = {}
+        self._path_trees_version = -1
+
+        # Secondary indexes mirroring the hottest node attributes so bulk
+        # filters don't scan every node's attribute dict. Inner dicts are
+        # used as ordered sets (keys only) to keep iteration deterministic.
+        self._nodes_by_type: Dict[str, Dict[str, None]] = defaultdict(dict)
+        self._poems_by_role: Dict[str, Dict[str, None]] = defaultdict(dict)
+
+        # Per-type entity lists sorted by usage frequency, rebuilt lazily
+        # when the graph version moves; frequency-band queries slice these
+        # with bisect instead of re-scanning and re-sorting every call
+        self._freq_cache: Dict[str, Tuple[int, List[Dict[str, Any]], List[int]]] = {}
+
+        # Version-keyed average structural profile (see average_structure)
+        self._avg_structure_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+
         if graph_path and Path(graph_path).exists():
             self.load_graph(graph_path)
+
+    def _mark_dirty(self) -> None:
+        """Record a structural mutation so cached derived data is invalidated."""
+        self._version += 1
+
+    def _index_poem_role(self, poem_id: str, role: Optional[str]) -> None:
+        """Move a poem into the index bucket for its narrative role."""
+        for members in self._poems_by_role.values():
+            members.pop(poem_id, None)
+        if role is not None:
+            self._poems_by_role[role][poem_id] = None
+
+    def _rebuild_indexes(self) -> None:
+        """Rebuild the type/role indexes from the underlying graph."""
+        self._nodes_by_type = defaultdict(dict)
+        self._poems_by_role = defaultdict(dict)
+        for node_id, node_data in self.graph.nodes(data=True):
+            node_type = node_data.get("type")
+            if node_type:
+                self._nodes_by_type[node_type][node_id] = None
+            if node_type == "poem":
+                role = node_data.get("narrative_role")
+                if role is not None:
+                    self._poems_by_role[role][node_id] = None
     
     # ==================== CORE CRUD OPERATIONS ====================
     
@@ -104,7 +155,9 @@ class ExtendedPoetryGraph:
             narrative_role=narrative_role,
             metadata=full_metadata
         )
-        
+        self._nodes_by_type["poem"][poem_id] = None
+        self._index_poem_role(poem_id, narrative_role)
+
         # Add and connect themes
         for theme in (themes or []):
             theme_id = f"theme_{theme.lower().replace(' ', '_')}"
@@ -128,6 +181,8 @@ class ExtendedPoetryGraph:
             device_id = f"sound_{sound_device.lower().replace(' ', '_')}"
             self._add_or_update_entity(device_id, "sound_device", sound_device)
             self.graph.add_edge(poem_id, device_id, type="uses_sound_device")
+
+        self._mark_dirty()
     
     def _add_or_update_entity(self, entity_id: str, entity_type: str, name: str) -> None:
         """Add an entity node or update its usage count if it exists."""
@@ -141,7 +196,84 @@ class ExtendedPoetryGraph:
                 usage_count=1,
                 created_at=datetime.now().isoformat()
             )
+            self._nodes_by_type[entity_type][entity_id] = None
     
+    def add_poems_bulk(self, poems: List[Dict[str, Any]]) -> None:
+        """
+        Add many poems in one batch of graph mutations.
+
+        Accepts a list of dicts with the same keys as add_poem's
+        parameters. Nodes and edges are accumulated into lists and handed
+        to NetworkX's add_nodes_from/add_edges_from once, and entity
+        usage counts are merged per batch, so initializing from a large
+        poem set performs three bulk inserts instead of a node/edge call
+        per element. Derived caches are invalidated once at the end.
+        """
+        entity_specs = [
+            ("themes", "theme", "theme_", "has_theme"),
+            ("imagery", "imagery", "img_", "contains_imagery"),
+            ("emotions", "emotion", "emo_", "conveys_emotion"),
+            ("sound_devices", "sound_device", "sound_", "uses_sound_device"),
+        ]
+
+        now = datetime.now().isoformat()
+        poem_nodes = []
+        entity_counts: Dict[str, List[Any]] = {}  # id -> [type, name, count]
+        edges = []
+
+        for spec in poems:
+            poem_id = spec["poem_id"]
+            full_metadata = dict(spec.get("metadata") or {})
+            if spec.get("structure_metadata"):
+                full_metadata["structure"] = spec["structure_metadata"]
+            if spec.get("sound_metadata"):
+                full_metadata["sound_patterns"] = spec["sound_metadata"]
+
+            narrative_role = spec.get("narrative_role", "route_generated")
+            poem_nodes.append((poem_id, {
+                "type": "poem",
+                "title": spec["title"],
+                "text": spec["text"],
+                "route_id": spec["route_id"],
+                "created_at": now,
+                "narrative_role": narrative_role,
+                "metadata": full_metadata,
+            }))
+
+            for field, entity_type, prefix, edge_type in entity_specs:
+                for name in (spec.get(field) or []):
+                    entity_id = f"{prefix}{name.lower().replace(' ', '_')}"
+                    entry = entity_counts.get(entity_id)
+                    if entry is None:
+                        entity_counts[entity_id] = [entity_type, name, 1]
+                    else:
+                        entry[2] += 1
+                    edges.append((poem_id, entity_id, {"type": edge_type}))
+
+        # Split entities into updates of existing nodes and fresh inserts
+        entity_nodes = []
+        for entity_id, (entity_type, name, count) in entity_counts.items():
+            if self.graph.has_node(entity_id):
+                self.graph.nodes[entity_id]["usage_count"] += count
+            else:
+                entity_nodes.append((entity_id, {
+                    "type": entity_type,
+                    "name": name,
+                    "usage_count": count,
+                    "created_at": now,
+                }))
+                self._nodes_by_type[entity_type][entity_id] = None
+
+        self.graph.add_nodes_from(poem_nodes)
+        self.graph.add_nodes_from(entity_nodes)
+        self.graph.add_edges_from(edges)
+
+        for poem_id, data in poem_nodes:
+            self._nodes_by_type["poem"][poem_id] = None
+            self._index_poem_role(poem_id, data["narrative_role"])
+
+        self._mark_dirty()
+
     def add_narrative_connection(
         self,
         poem_id_1: str,
@@ -160,6 +292,7 @@ class ExtendedPoetryGraph:
             notes=notes,
             created_at=datetime.now().isoformat()
         )
+        self._mark_dirty()
     
     def get_poem(self, poem_id: str) -> Optional[Dict[str, Any]]:
         """Get full poem data including all connections."""
@@ -215,37 +348,66 @@ class ExtendedPoetryGraph:
         """Get themes that are underutilized."""
         return self._get_entities_by_frequency("theme", 0, max_frequency)
     
-    def _get_entities_by_frequency(
+    def _entities_sorted_by_freq(
         self,
-        entity_type: str,
-        min_freq: Optional[int] = None,
-        max_freq: Optional[int] = None
-    ) -> List[Dict[str, Any]]:
-        """Generic method to filter entities by usage frequency."""
+        entity_type: str
+    ) -> Tuple[List[Dict[str, Any]], List[int]]:
+        """All entities of a type sorted by usage_count descending.
+
+        Rebuilt only when the graph has mutated since the last build;
+        returns the entity list plus a parallel list of negated counts
+        for bisect-based band slicing.
+        """
+        cached = self._freq_cache.get(entity_type)
+        if cached is not None and cached[0] == self._version:
+            return cached[1], cached[2]
+
         entities = []
-        
-        for node_id, node_data in self.graph.nodes(data=True):
-            if node_data.get("type") != entity_type:
-                continue
-            
-            usage_count = node_data.get("usage_count", 0)
-            
-            if min_freq is not None and usage_count < min_freq:
+        stale_ids = []
+        for node_id in self._nodes_by_type.get(entity_type, ()):
+            # Tolerate ids whose nodes were removed behind the index's
+            # back (e.g. code mutating graph.graph directly); drop them
+            # below rather than crashing every consumer of the cache
+            if not self.graph.has_node(node_id):
+                stale_ids.append(node_id)
                 continue
-            if max_freq is not None and usage_count > max_freq:
-                continue
-            
-            using_routes = self._get_routes_using_entity(node_id)
-            
+            node_data = self.graph.nodes[node_id]
             entities.append({
                 "id": node_id,
                 "name": node_data["name"],
-                "usage_count": usage_count,
-                "used_by_routes": using_routes,
+                "usage_count": node_data.get("usage_count", 0),
+                "used_by_routes": self._get_routes_using_entity(node_id),
                 "created_at": node_data.get("created_at")
             })
-        
-        return sorted(entities, key=lambda x: x["usage_count"], reverse=True)
+
+        if stale_ids:
+            for node_id in stale_ids:
+                self._nodes_by_type[entity_type].pop(node_id, None)
+
+        entities.sort(key=lambda x: x["usage_count"], reverse=True)
+        neg_counts = [-e["usage_count"] for e in entities]
+        self._freq_cache[entity_type] = (self._version, entities, neg_counts)
+        return entities, neg_counts
+
+    def _get_entities_by_frequency(
+        self,
+        entity_type: str,
+        min_freq: Optional[int] = None,
+        max_freq: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Generic method to filter entities by usage frequency."""
+        entities, neg_counts = self._entities_sorted_by_freq(entity_type)
+
+        # Descending order means a minimum frequency cuts a prefix and a
+        # maximum cuts a suffix; bisect finds both boundaries in O(log n)
+        lo = 0
+        hi = len(entities)
+        if min_freq is not None and min_freq > 0:
+            hi = bisect_right(neg_counts, -min_freq)
+        if max_freq is not None:
+            lo = bisect_left(neg_counts, -max_freq)
+
+        return entities[lo:hi]
     
     def _get_routes_using_entity(self, entity_id: str) -> List[str]:
         """Get list of route IDs that have used this entity."""
@@ -264,26 +426,22 @@ class ExtendedPoetryGraph:
         limit: int = 10
     ) -> List[Dict[str, Any]]:
         """Find combinations of entities that have never appeared together."""
-        # Get all existing combinations
+        # Get all existing combinations; the type index narrows each scan
+        # to poem nodes instead of walking the whole graph
         existing_combos = set()
-        for node_id, node_data in self.graph.nodes(data=True):
-            if node_data.get("type") != "poem":
-                continue
-            
+        for node_id in self._nodes_by_type.get("poem", ()):
             entities_1 = [n for n in self.graph.neighbors(node_id)
                          if self.graph.nodes[n].get("type") == entity_type_1]
             entities_2 = [n for n in self.graph.neighbors(node_id)
                          if self.graph.nodes[n].get("type") == entity_type_2]
-            
+
             for e1 in entities_1:
                 for e2 in entities_2:
                     existing_combos.add((e1, e2))
-        
+
         # Find all possible entities of each type
-        all_entities_1 = [n for n, d in self.graph.nodes(data=True)
-                         if d.get("type") == entity_type_1]
-        all_entities_2 = [n for n, d in self.graph.nodes(data=True)
-                         if d.get("type") == entity_type_2]
+        all_entities_1 = list(self._nodes_by_type.get(entity_type_1, ()))
+        all_entities_2 = list(self._nodes_by_type.get(entity_type_2, ()))
         
         # Find unexplored combinations
         unexplored = []
@@ -322,8 +480,7 @@ class ExtendedPoetryGraph:
                         current_patterns.add(neighbor)
         
         # Get all possible patterns
-        all_patterns = [n for n, d in self.graph.nodes(data=True)
-                       if d.get("type") == pattern_type]
+        all_patterns = list(self._nodes_by_type.get(pattern_type, ()))
         
         # Return patterns NOT currently used
         inverse_patterns = []
@@ -397,10 +554,10 @@ class ExtendedPoetryGraph:
         
         # Get all poems without it
         poems_without = []
-        for node_id, node_data in self.graph.nodes(data=True):
-            if node_data.get("type") == "poem" and node_id not in poems_with:
+        for node_id in self._nodes_by_type.get("poem", ()):
+            if node_id not in poems_with:
                 poems_without.append(self.get_poem(node_id))
-        
+
         return poems_without
     
     def get_sound_device_co_occurrence_with_theme(
@@ -474,9 +631,9 @@ class ExtendedPoetryGraph:
         - Enjambment frequency
         """
         poems = [
-            (node_id, node_data)
-            for node_id, node_data in self.graph.nodes(data=True)
-            if node_data.get("type") == "poem" and node_data.get("route_id") == route_id
+            (node_id, self.graph.nodes[node_id])
+            for node_id in self._nodes_by_type.get("poem", ())
+            if self.graph.nodes[node_id].get("route_id") == route_id
         ]
         
         if not poems:
@@ -547,8 +704,8 @@ class ExtendedPoetryGraph:
     
     def get_route_statistics(self, route_id: str) -> Dict[str, Any]:
         """Get comprehensive statistics about a route's contributions."""
-        poems = [n for n, d in self.graph.nodes(data=True)
-                if d.get("type") == "poem" and d.get("route_id") == route_id]
+        poems = [n for n in self._nodes_by_type.get("poem", ())
+                if self.graph.nodes[n].get("route_id") == route_id]
         
         if not poems:
             return {
@@ -610,7 +767,89 @@ class ExtendedPoetryGraph:
                 pickle.dump(self.graph, f)
         else:
             raise ValueError(f"Unknown format: {format}")
-    
+
+        # A full save captures everything, so any pending delta journal
+        # is compacted away
+        delta_path = Path(f"{save_path}.delta.jsonl")
+        if delta_path.exists():
+            delta_path.unlink()
+
+    def save_graph_delta(self, dirty_ids: Set[str], path: Optional[str] = None) -> None:
+        """
+        Append only the given nodes and their incident edges to a delta journal.
+
+        Re-serializing the whole graph on every incremental run rewrites
+        every unchanged poem. Instead, each dirty node (plus the entity
+        nodes it points at, so their usage counts travel with it) is
+        appended as one JSONL record to <graph_path>.delta.jsonl;
+        load_graph replays the journal on top of the base file, and the
+        next full save_graph compacts it away. Falls back to a full save
+        when the base file does not exist yet.
+        """
+        save_path = path or self.graph_path
+        if not save_path:
+            raise ValueError("No path provided and no default path set")
+        if not Path(save_path).exists():
+            self.save_graph(save_path)
+            return
+
+        nodes = self.graph.nodes
+        records = []
+        for node_id in dirty_ids:
+            if not self.graph.has_node(node_id):
+                continue
+            record_nodes = [{"id": node_id, **nodes[node_id]}]
+            edges = []
+            for _, target, edge_data in self.graph.out_edges(node_id, data=True):
+                record_nodes.append({"id": target, **nodes[target]})
+                edges.append({"source": node_id, "target": target, **edge_data})
+            for source, _, edge_data in self.graph.in_edges(node_id, data=True):
+                edges.append({"source": source, "target": node_id, **edge_data})
+            records.append({"nodes": record_nodes, "edges": edges})
+
+        delta_path = f"{save_path}.delta.jsonl"
+        with open(delta_path, 'ab') as f:
+            if orjson is not None:
+                for record in records:
+                    f.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+            else:
+                for record in records:
+                    f.write(json.dumps(record).encode("utf-8") + b"\n")
+
+    def _apply_delta(self, path: str) -> None:
+        """Replay the delta journal written by save_graph_delta, if any."""
+        delta_path = Path(f"{path}.delta.jsonl")
+        if not delta_path.exists():
+            return
+
+        loads = orjson.loads if orjson is not None else json.loads
+        with open(delta_path, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = loads(line)
+
+                # The first node of a record is the dirty node; drop its
+                # stale incident edges so replaying an updated record
+                # doesn't accumulate duplicate multi-edges
+                primary_id = record["nodes"][0]["id"]
+                if self.graph.has_node(primary_id):
+                    self.graph.remove_edges_from(
+                        list(self.graph.out_edges(primary_id))
+                        + list(self.graph.in_edges(primary_id))
+                    )
+
+                for node in record["nodes"]:
+                    attrs = dict(node)
+                    node_id = attrs.pop("id")
+                    self.graph.add_node(node_id, **attrs)
+
+                for edge in record["edges"]:
+                    attrs = dict(edge)
+                    source = attrs.pop("source")
+                    target = attrs.pop("target")
+                    self.graph.add_edge(source, target, **attrs)
+
     def load_graph(self, path: str, format: str = None) -> None:
         """Load graph from disk."""
         if format is None:
@@ -625,9 +864,61 @@ class ExtendedPoetryGraph:
                 self.graph = pickle.load(f)
         else:
             raise ValueError(f"Unknown format: {format}")
-        
+
         self.graph_path = path
-    
+        self._apply_delta(path)
+        self._rebuild_indexes()
+        self._mark_dirty()
+
+    @staticmethod
+    def _cache_path(path: str) -> str:
+        """Path of the pickle sidecar next to the JSON graph file."""
+        return str(Path(path).with_suffix(".pkl"))
+
+    @staticmethod
+    def _cache_key(path: str) -> tuple:
+        """Cache key covering the base graph file and its delta journal."""
+        key = [Path(path).stat().st_mtime_ns]
+        try:
+            key.append(Path(f"{path}.delta.jsonl").stat().st_mtime_ns)
+        except OSError:
+            key.append(0)
+        return tuple(key)
+
+    @classmethod
+    def load_cached(cls, path: str) -> Optional["ExtendedPoetryGraph"]:
+        """Load a graph from its pickle sidecar if it is still fresh.
+
+        Unpickling the prepared NetworkX graph is much faster than
+        re-parsing node-link JSON, which dominates runtime for CLIs that
+        load the graph on every invocation. The sidecar stores the
+        source files' mtimes; any mismatch (or load failure) means the
+        cache is stale and None is returned.
+        """
+        try:
+            with open(cls._cache_path(path), 'rb') as f:
+                cached_key, nx_graph = pickle.load(f)
+            if cached_key != cls._cache_key(path):
+                return None
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+            return None
+
+        graph = cls()
+        graph.graph = nx_graph
+        graph.graph_path = path
+        graph._rebuild_indexes()
+        graph._mark_dirty()
+        return graph
+
+    def refresh_cache(self) -> None:
+        """Write the pickle sidecar for the current graph state."""
+        try:
+            with open(self._cache_path(self.graph_path), 'wb') as f:
+                pickle.dump((self._cache_key(self.graph_path), self.graph), f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass
+
     def export_to_dict(self) -> Dict[str, Any]:
         """Export graph to a simple dictionary format for API responses."""
         return {
@@ -649,27 +940,22 @@ class ExtendedPoetryGraph:
             "stats": {
                 "total_nodes": self.graph.number_of_nodes(),
                 "total_edges": self.graph.number_of_edges(),
-                "poem_count": len([n for n, d in self.graph.nodes(data=True)
-                                  if d.get("type") == "poem"]),
-                "theme_count": len([n for n, d in self.graph.nodes(data=True)
-                                   if d.get("type") == "theme"]),
-                "imagery_count": len([n for n, d in self.graph.nodes(data=True)
-                                     if d.get("type") == "imagery"]),
-                "emotion_count": len([n for n, d in self.graph.nodes(data=True)
-                                     if d.get("type") == "emotion"]),
-                "sound_device_count": len([n for n, d in self.graph.nodes(data=True)
-                                          if d.get("type") == "sound_device"])
+                "poem_count": len(self._nodes_by_type.get("poem", ())),
+                "theme_count": len(self._nodes_by_type.get("theme", ())),
+                "imagery_count": len(self._nodes_by_type.get("imagery", ())),
+                "emotion_count": len(self._nodes_by_type.get("emotion", ())),
+                "sound_device_count": len(self._nodes_by_type.get("sound_device", ()))
             }
         }
     
     def get_graph_summary(self) -> Dict[str, Any]:
         """Get a high-level summary of the graph."""
-        poems = [n for n, d in self.graph.nodes(data=True) if d.get("type") == "poem"]
-        themes = [n for n, d in self.graph.nodes(data=True) if d.get("type") == "theme"]
-        imagery = [n for n, d in self.graph.nodes(data=True) if d.get("type") == "imagery"]
-        emotions = [n for n, d in self.graph.nodes(data=True) if d.get("type") == "emotion"]
-        sound_devices = [n for n, d in self.graph.nodes(data=True) if d.get("type") == "sound_device"]
-        
+        poems = list(self._nodes_by_type.get("poem", ()))
+        themes = self._nodes_by_type.get("theme", ())
+        imagery = self._nodes_by_type.get("imagery", ())
+        emotions = self._nodes_by_type.get("emotion", ())
+        sound_devices = self._nodes_by_type.get("sound_device", ())
+
         routes = set()
         for node_id in poems:
             route_id = self.graph.nodes[node_id].get("route_id")
@@ -709,7 +995,44 @@ class ExtendedPoetryGraph:
                     co_occurrences[(e1, e2)] += 1
         
         return dict(co_occurrences)
-    
+
+    def get_all_co_occurrences(
+        self,
+        types: Tuple[str, ...] = ("theme", "imagery", "emotion", "sound_device")
+    ) -> Dict[Tuple[str, str], Dict[Tuple[str, str], int]]:
+        """Co-occurrence counts for every ordered pair of entity types.
+
+        One sweep over the poems: each poem's attached elements are
+        grouped by type once and every type pair is tallied from those
+        groups, instead of re-walking the whole graph per pair as
+        repeated get_entity_co_occurrence calls do. Returns a mapping of
+        (type_a, type_b) to that pair's co-occurrence dict.
+        """
+        type_set = frozenset(types)
+        pair_counts: Dict[Tuple[str, str], Counter] = {
+            (t1, t2): Counter() for t1 in types for t2 in types if t1 != t2
+        }
+
+        nodes = self.graph.nodes
+        succ = self.graph.succ
+        for poem_id in self._nodes_by_type["poem"]:
+            by_type: Dict[str, List[str]] = defaultdict(list)
+            for neighbor in succ[poem_id]:
+                neighbor_data = nodes[neighbor]
+                if neighbor_data.get("type") in type_set:
+                    by_type[neighbor_data["type"]].append(neighbor_data["name"])
+
+            for t1, names_1 in by_type.items():
+                for t2, names_2 in by_type.items():
+                    if t1 == t2:
+                        continue
+                    counter = pair_counts[(t1, t2)]
+                    for e1 in names_1:
+                        for e2 in names_2:
+                            counter[(e1, e2)] += 1
+
+        return {pair: dict(counter) for pair, counter in pair_counts.items()}
+
     # ==================== NARRATIVE MANAGEMENT ====================
     
     def mark_poem_as_core(self, poem_id: str) -> bool:
@@ -734,6 +1057,7 @@ class ExtendedPoetryGraph:
             return False
         
         self.graph.nodes[poem_id]["narrative_role"] = role
+        self._index_poem_role(poem_id, role)
         return True
     
     def get_core_poems(self) -> List[Dict[str, Any]]:
@@ -750,13 +1074,7 @@ class ExtendedPoetryGraph:
     
     def _get_poems_by_narrative_role(self, role: str) -> List[Dict[str, Any]]:
         """Get poems by their narrative role."""
-        poems = []
-        for node_id, node_data in self.graph.nodes(data=True):
-            if (node_data.get("type") == "poem" and 
-                node_data.get("narrative_role") == role):
-                
-                full_poem_data = self.get_poem(node_id)
-                poems.append(full_poem_data)
+        poems = [self.get_poem(node_id) for node_id in self._poems_by_role.get(role, ())]
         
         # Sort by creation date
         poems.sort(key=lambda x: x.get("created_at", ""), reverse=True)
@@ -792,6 +1110,7 @@ class ExtendedPoetryGraph:
             notes=notes,
             created_at=datetime.now().isoformat()
         )
+        self._mark_dirty()
         return True
     
     def get_narrative_summary(self) -> Dict[str, Any]:
@@ -847,7 +1166,9 @@ class ExtendedPoetryGraph:
         
         # Remove the poem node (automatically removes all edges)
         self.graph.remove_node(poem_id)
-        
+        self._nodes_by_type["poem"].pop(poem_id, None)
+        self._index_poem_role(poem_id, None)
+
         # Clean up orphaned entities if requested
         if cleanup_orphaned_entities:
             for entity_id, entity_type in connected_entities:
@@ -861,9 +1182,47 @@ class ExtendedPoetryGraph:
                     # Remove entity if no poems use it
                     if not has_poem_connections:
                         self.graph.remove_node(entity_id)
-        
+                        self._nodes_by_type[entity_type].pop(entity_id, None)
+
+        self._mark_dirty()
         return True
     
+    def remove_entity(self, entity_id: str) -> bool:
+        """
+        Remove an entity node (theme, imagery, emotion, sound_device).
+
+        Callers must not use graph.graph.remove_node directly: this
+        keeps the type index in step and invalidates the version-keyed
+        caches, which a raw NetworkX removal would leave stale.
+
+        Returns:
+            True if the node was removed, False if not found
+        """
+        if not self.graph.has_node(entity_id):
+            return False
+
+        entity_type = self.graph.nodes[entity_id].get("type")
+        self.graph.remove_node(entity_id)
+        if entity_type:
+            self._nodes_by_type[entity_type].pop(entity_id, None)
+        self._mark_dirty()
+        return True
+
+    def remove_edge(self, source_id: str, target_id: str) -> bool:
+        """
+        Remove all edges between two nodes, invalidating cached queries.
+
+        Returns:
+            True if at least one edge was removed, False if none existed
+        """
+        if not self.graph.has_edge(source_id, target_id):
+            return False
+
+        while self.graph.has_edge(source_id, target_id):
+            self.graph.remove_edge(source_id, target_id)
+        self._mark_dirty()
+        return True
+
     def remove_narrative_connection(self, source_poem_id: str, target_poem_id: str) -> bool:
         """Remove narrative connection between two poems."""
         if not (self.graph.has_node(source_poem_id) and self.graph.has_node(target_poem_id)):
@@ -872,17 +1231,27 @@ class ExtendedPoetryGraph:
         # Remove narrative connection edges
         if self.graph.has_edge(source_poem_id, target_poem_id):
             edge_data = self.graph.get_edge_data(source_poem_id, target_poem_id)
-            edges_to_remove = []
-            
-            for key, data in edge_data.items():
-                if data.get("type") == "narrative_connection":
-                    edges_to_remove.append(key)
-            
-            for key in edges_to_remove:
+
+            if not isinstance(self.graph, nx.MultiDiGraph):
+                # Simple graph: one edge, no key indexing needed
+                if edge_data.get("type") == "narrative_connection":
+                    self.graph.remove_edge(source_poem_id, target_poem_id)
+                    self._mark_dirty()
+                    return True
+                return False
+
+            # Snapshot matching keys first to avoid mutating during iteration
+            keys_to_remove = [
+                key for key, data in edge_data.items()
+                if data.get("type") == "narrative_connection"
+            ]
+            for key in keys_to_remove:
                 self.graph.remove_edge(source_poem_id, target_poem_id, key)
-                
-            return len(edges_to_remove) > 0
-        
+
+            if keys_to_remove:
+                self._mark_dirty()
+            return bool(keys_to_remove)
+
         return False
     
     def clear_narrative_role(self, poem_id: str) -> bool:
@@ -897,7 +1266,8 @@ class ExtendedPoetryGraph:
         # Remove narrative_role or set to None
         if "narrative_role" in self.graph.nodes[poem_id]:
             del self.graph.nodes[poem_id]["narrative_role"]
-        
+        self._index_poem_role(poem_id, None)
+
         return True
     
     def remove_poems_by_narrative_role(self, role: str, confirm_callback=None) -> int:
@@ -911,24 +1281,40 @@ class ExtendedPoetryGraph:
         Returns:
             Number of poems removed
         """
-        poems_to_remove = []
-        
-        for node_id, node_data in self.graph.nodes(data=True):
-            if (node_data.get("type") == "poem" and 
-                node_data.get("narrative_role") == role):
-                poems_to_remove.append((node_id, node_data))
-        
+        # Snapshot the role index; remove_poem mutates it as we go
+        return self.remove_poems_by_ids(tuple(self._poems_by_role.get(role, ())),
+                                        confirm_callback)
+
+    def remove_poems_by_ids(self, poem_ids, confirm_callback=None) -> int:
+        """
+        Remove the given poems by id, optionally confirming each removal.
+
+        Callers that already hold the target ids (e.g. from a cached
+        role index) skip any node scan or index lookup here.
+
+        Args:
+            poem_ids: Iterable of poem node ids to remove
+            confirm_callback: Optional function(poem_id, title, role)
+                returning False to skip a poem
+
+        Returns:
+            Number of poems removed
+        """
         removed_count = 0
-        for poem_id, poem_data in poems_to_remove:
+        for poem_id in tuple(poem_ids):
             should_remove = True
-            
+
             if confirm_callback:
-                title = poem_data.get("title", "Untitled")
-                should_remove = confirm_callback(poem_id, title, role)
-            
+                data = self.graph.nodes.get(poem_id, {})
+                should_remove = confirm_callback(
+                    poem_id,
+                    data.get("title", "Untitled"),
+                    data.get("narrative_role", "unassigned"),
+                )
+
             if should_remove and self.remove_poem(poem_id):
                 removed_count += 1
-        
+
         return removed_count
     
     # ==================== PATH AND NETWORK ANALYSIS ====================
@@ -939,20 +1325,55 @@ class ExtendedPoetryGraph:
         poem_id_2: str
     ) -> Optional[List[str]]:
         """Find the shortest path between two poems through shared entities."""
-        try:
-            undirected = self.graph.to_undirected()
-            path = nx.shortest_path(undirected, poem_id_1, poem_id_2)
-            return path
-        except (nx.NetworkXNoPath, nx.NodeNotFound):
+        if not self.graph.has_node(poem_id_1):
             return None
+
+        # Cache the full shortest-path tree per source so dashboards querying
+        # many targets from the same poem don't recompute from scratch
+        if self._path_trees_version != self._version:
+            self._path_trees.clear()
+            self._path_trees_version = self._version
+
+        tree = self._path_trees.get(poem_id_1)
+        if tree is None:
+            undirected = self.graph.to_undirected(as_view=True)
+            tree = nx.single_source_shortest_path(undirected, poem_id_1)
+            self._path_trees[poem_id_1] = tree
+
+        return tree.get(poem_id_2)
     
     def get_all_routes_statistics(self) -> List[Dict[str, Any]]:
         """Get statistics for all routes that have contributed poems."""
         route_ids = set()
-        for node_id, node_data in self.graph.nodes(data=True):
-            if node_data.get("type") == "poem":
-                route_id = node_data.get("route_id")
-                if route_id:
-                    route_ids.add(route_id)
+        for node_id in self._nodes_by_type.get("poem", ()):
+            route_id = self.graph.nodes[node_id].get("route_id")
+            if route_id:
+                route_ids.add(route_id)
         
         return [self.get_route_statistics(route_id) for route_id in sorted(route_ids)]
+
+    @property
+    def average_structure(self) -> Dict[str, Any]:
+        """Average structural profile across established routes.
+
+        Derived from routes with more than two poems; cached against the
+        graph version like the frequency bands, so loyal-mode prompt
+        builds read a precomputed dict instead of reducing every route's
+        statistics each call.
+        """
+        cached = self._avg_structure_cache
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+
+        line_counts = []
+        for stats in self.get_all_routes_statistics():
+            if stats.get("poem_count", 0) > 2:
+                metrics = stats.get("structure_metrics")
+                line_counts.append(metrics.get("avg_line_count", 12) if metrics else 12)
+
+        avg_structure = {
+            "avg_line_count": sum(line_counts) / len(line_counts) if line_counts else 12,
+            "common_stanza_pattern": [4, 4, 4]  # Default quatrain pattern
+        }
+        self._avg_structure_cache = (self._version, avg_structure)
+        return avg_structure
@@ -14,6 +14,12 @@ import re
 from typing import Dict, List, Any, Optional
 from openai import AzureOpenAI
 import os
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 from config import AZURE_OPENAI_API_KEY, AZURE_OPENAI_ENDPOINT, AZURE_OPENAI_DEPLOYMENT_NAME, AZURE_OPENAI_API_VERSION
 
 
@@ -23,7 +29,9 @@ class PoemAnalyzer:
     Analyzes poems using Azure OpenAI to extract metadata for the knowledge graph.
     Compatible with your existing Azure setup.
     """
-    
+
+    __slots__ = ("azure_endpoint", "api_key", "api_version", "deployment_name", "client")
+
     def __init__(
         self,
         azure_endpoint: Optional[str] = None,
@@ -182,8 +190,8 @@ Example format:
             json_str = response_text.strip()
         
         try:
-            metadata = json.loads(json_str)
-        except json.JSONDecodeError as e:
+            metadata = _loads(json_str)
+        except ValueError as e:  # covers json and orjson JSONDecodeError
             # Fallback: return empty structure
             print(f"Failed to parse LLM response: {e}")
             metadata = {
@@ -277,10 +285,12 @@ Example format:
         
         lines = poem_text.lower().split('\n')
         words = poem_text.lower().split()
-        
+
+        # Tokenize each non-empty line once; first/last word checks reuse this
+        tokenized = [toks for line in lines if (toks := line.strip().split())]
+
         # Check for end rhyme
-        last_words = [line.strip().split()[-1] if line.strip().split() else "" 
-                     for line in lines if line.strip()]
+        last_words = [toks[-1] for toks in tokenized]
         if len(set(last_words)) < len(last_words) * 0.8:
             sound_devices.append("end_rhyme")
         
@@ -301,8 +311,7 @@ Example format:
             sound_devices.append("repetition")
         
         # Check for anaphora
-        first_words = [line.strip().split()[0] if line.strip().split() else ""
-                      for line in lines if line.strip()]
+        first_words = [toks[0] for toks in tokenized]
         if len(first_words) != len(set(first_words)):
             sound_devices.append("anaphora")
         
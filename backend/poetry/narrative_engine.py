@@ -1,3 +1,5 @@
+from bisect import bisect_left, bisect_right
+
 # Mock poetry collection - replace with actual source later
 MOCK_POETRY_COLLECTION = {
     "central_themes": [
@@ -22,16 +24,27 @@ MOCK_POETRY_COLLECTION = {
     "emotional_register": "observant, political, communal"
 }
 
+# Precomputed immutable slices of the collection so apply_story_influence
+# doesn't re-slice the same constant lists on every call
+_CORE_MOTIFS_FIRST3 = tuple(MOCK_POETRY_COLLECTION["core_motifs"][:3])
+_CORE_MOTIFS_FIRST2 = tuple(MOCK_POETRY_COLLECTION["core_motifs"][:2])
+_CORE_MOTIFS_1_3 = tuple(MOCK_POETRY_COLLECTION["core_motifs"][1:3])
+_NARRATIVE_FRAGMENTS_FIRST2 = tuple(MOCK_POETRY_COLLECTION["narrative_fragments"][:2])
+
+# Stance lookup: index 0 covers <= 0.3, index 2 covers >= 0.7
+_STANCE_TABLE = ("opposing", "ambivalent", "supporting")
+_LOW_CUT = (0.3,)
+_HIGH_CUT = (0.7,)
+
 def get_narrative_stance(story_influence):
     """
     Determine route's stance toward the central narrative.
     """
-    if story_influence <= 0.3:
-        return "opposing"
-    elif story_influence >= 0.7:
-        return "supporting" 
-    else:
-        return "ambivalent"
+    # bisect_left keeps 0.3 itself in "opposing"; bisect_right keeps
+    # 0.7 itself in "supporting" - same boundaries as the old if/elif chain
+    return _STANCE_TABLE[
+        bisect_left(_LOW_CUT, story_influence) + bisect_right(_HIGH_CUT, story_influence)
+    ]
 
 def apply_story_influence(route, personality, story_influence):
     """
@@ -54,19 +67,19 @@ def apply_story_influence(route, personality, story_influence):
     quirks = personality['quirks']
     
     if stance == "supporting":
-        emphasized_motifs = collection["core_motifs"][:3]  # Embrace core motifs
+        emphasized_motifs = _CORE_MOTIFS_FIRST3  # Embrace core motifs
         rejected_motifs = []
         emotional_tone = f"{tone} but harmonious with urban observation"
-        narrative_fragments = collection["narrative_fragments"][:2]
-        
+        narrative_fragments = _NARRATIVE_FRAGMENTS_FIRST2
+
     elif stance == "opposing":
         emphasized_motifs = ["freedom from surveillance", "escape routes", "hidden spaces"]
-        rejected_motifs = collection["core_motifs"][:2]  # Reject surveillance themes
+        rejected_motifs = _CORE_MOTIFS_FIRST2  # Reject surveillance themes
         emotional_tone = f"{tone} but defiant toward observation"
         narrative_fragments = ["this route refuses to be catalogued", "movement without witness"]
-        
+
     else:  # ambivalent
-        emphasized_motifs = collection["core_motifs"][1:3]  # Selective engagement
+        emphasized_motifs = _CORE_MOTIFS_1_3  # Selective engagement
         rejected_motifs = [collection["core_motifs"][0]]  # Partial rejection
         emotional_tone = f"{tone} but conflicted about visibility"
         narrative_fragments = ["sometimes watched, sometimes free"]
@@ -5,13 +5,31 @@ FastAPI endpoints for viewing and modifying route personalities.
 Add this to your backend.
 """
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import BaseModel, Field, ValidationError
 from typing import Dict, List, Any, Optional
+import asyncio
 import json
+import mmap
+import os
+import re
+import threading
 from pathlib import Path
 
-router = APIRouter(prefix="/api/personalities", tags=["personalities"])
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson-backed responses skip FastAPI's jsonable_encoder walk on every reply
+_response_class = ORJSONResponse if orjson is not None else JSONResponse
+
+router = APIRouter(
+    prefix="/api/personalities",
+    tags=["personalities"],
+    default_response_class=_response_class,
+)
 
 # Path to personalities file
 PERSONALITIES_FILE = Path(__file__).parent.parent / "data" / "route_personalities.json"
@@ -117,57 +135,323 @@ class UpdatePersonalityRequest(BaseModel):
 
 # ==================== HELPER FUNCTIONS ====================
 
-def load_personalities() -> Dict[str, Dict[str, Any]]:
-    """Load personalities from JSON file."""
-    if not PERSONALITIES_FILE.exists():
+# Per-route storage: each personality lives in its own JSON file under
+# this directory, so a single mutation writes a few hundred bytes
+# instead of rewriting one aggregate file. The legacy aggregate file
+# (and its append-only mutation log, if one is left over) is migrated
+# into the directory on first load; the aggregate format survives only
+# as the bulk import/export payload.
+PERSONALITIES_DIR = PERSONALITIES_FILE.parent / "route_personalities"
+PERSONALITIES_LOG = PERSONALITIES_FILE.with_suffix('.jsonl')
+
+# Files past this size are memory-mapped instead of read into a bytes
+# object; below it mmap setup costs more than the copy it saves
+_MMAP_THRESHOLD = 64 * 1024
+
+# In-process cache of the parsed personalities, keyed on the storage
+# directory's mtime (renames and unlinks both bump it) so read-heavy
+# endpoints skip re-parsing when nothing changed on disk
+_cache_lock = threading.Lock()
+_cached_personalities: Optional[Dict[str, Dict[str, Any]]] = None
+_cached_models: Dict[str, "RoutePersonality"] = {}
+_route_ids: set = set()
+_cached_mtime_ns: int = -1
+
+
+def _json_dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Route ids become file names under PERSONALITIES_DIR and arrive from
+# URL segments and bulk-import payload keys, so anything outside this
+# allowlist (path separators, '..', empty strings) must be refused
+# before it reaches a write or unlink
+_ROUTE_ID_RE = re.compile(r'[A-Za-z0-9_-]+\Z')
+
+
+def _require_route_id(route_id: Any) -> str:
+    """Reject route ids that could escape the storage directory."""
+    if not isinstance(route_id, str) or not _ROUTE_ID_RE.fullmatch(route_id):
+        raise HTTPException(
+            status_code=422,
+            detail=f"Invalid route id: {route_id!r}"
+        )
+    return route_id
+
+
+def _route_path(route_id: str) -> Path:
+    """Path of the per-route personality file."""
+    # Last line of defense for callers that bypass the endpoint checks
+    if not _ROUTE_ID_RE.fullmatch(route_id):
+        raise ValueError(f"Invalid route id: {route_id!r}")
+    return PERSONALITIES_DIR / f"{route_id}.json"
+
+
+def _load_json_file(path: Path) -> Any:
+    """Parse one JSON file, memory-mapping it past the size threshold."""
+    size = path.stat().st_size
+    if size == 0:
         return {}
-    
-    with open(PERSONALITIES_FILE, 'r') as f:
-        return json.load(f)
+    if size > _MMAP_THRESHOLD:
+        # Map large files read-only and parse straight out of the page
+        # cache, skipping the userspace bytes copy
+        with open(path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                # orjson parses a memoryview zero-copy; stdlib json
+                # needs a bytes copy
+                if orjson is not None:
+                    return orjson.loads(memoryview(mm))
+                return json.loads(mm[:])
+            finally:
+                mm.close()
+    # One syscall into a contiguous buffer parses faster than letting
+    # json read the stream incrementally
+    return _json_loads(path.read_bytes())
+
+
+def _write_json_file(path: Path, buf: bytes) -> None:
+    """Atomic write: sibling tmp file then rename over the target."""
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_bytes(buf)
+    os.replace(tmp, path)
+
+
+def _migrate_aggregate() -> None:
+    """One-time migration from the aggregate-file layout.
+
+    Splits the legacy route_personalities.json (plus any leftover
+    mutation log) into per-route files, then retires the log.
+    """
+    personalities: Dict[str, Dict[str, Any]] = {}
+    if PERSONALITIES_FILE.exists():
+        personalities = _load_json_file(PERSONALITIES_FILE)
+
+    if PERSONALITIES_LOG.exists():
+        with open(PERSONALITIES_LOG, 'rb') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                entry = _json_loads(line)
+                if entry.get("op") == "put":
+                    personalities[entry["id"]] = entry["data"]
+                elif entry.get("op") == "del":
+                    personalities.pop(entry["id"], None)
+
+    PERSONALITIES_DIR.mkdir(parents=True, exist_ok=True)
+    for route_id, data in personalities.items():
+        if not isinstance(route_id, str) or not _ROUTE_ID_RE.fullmatch(route_id):
+            print(f"Skipping invalid route id during migration: {route_id!r}")
+            continue
+        _write_json_file(_route_path(route_id), _json_dumps(data))
+
+    if PERSONALITIES_LOG.exists():
+        PERSONALITIES_LOG.unlink()
+
+
+def load_personalities() -> Dict[str, Dict[str, Any]]:
+    """Load all personalities from the per-route files (cached)."""
+    global _cached_personalities, _cached_models, _route_ids, _cached_mtime_ns
+
+    with _cache_lock:
+        if not PERSONALITIES_DIR.exists():
+            _migrate_aggregate()
+
+        mtime_ns = PERSONALITIES_DIR.stat().st_mtime_ns
+        if mtime_ns == _cached_mtime_ns and _cached_personalities is not None:
+            return _cached_personalities
+
+        personalities = {}
+        with os.scandir(PERSONALITIES_DIR) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.json'):
+                    continue
+                # One unreadable or malformed file must not take down
+                # every personalities endpoint until it is hand-deleted
+                try:
+                    data = _load_json_file(Path(entry.path))
+                except (OSError, ValueError) as e:
+                    print(f"Skipping unreadable personality file {entry.name}: {e}")
+                    continue
+                if not isinstance(data, dict):
+                    print(f"Skipping malformed personality file {entry.name}")
+                    continue
+                personalities[entry.name[:-5]] = data
+
+        _cached_personalities = personalities
+        # On-disk data already passed validation when it was written, so
+        # model_construct skips re-running Pydantic validation per field
+        _cached_models = {
+            route_id: RoutePersonality.model_construct(**data)
+            for route_id, data in personalities.items()
+        }
+        _route_ids = set(personalities)
+        _cached_mtime_ns = mtime_ns
+        return personalities
+
+
+def apply_personality_mutation(
+    op: str,
+    route_id: str,
+    data: Optional[Dict[str, Any]] = None,
+    model: Optional["RoutePersonality"] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Apply a single put/del mutation: write or unlink just that route's
+    file and update the in-memory caches in place.
+
+    Endpoints that already hold a validated RoutePersonality pass it as
+    `model` so the model cache is updated without re-validation.
+    """
+    global _cached_personalities, _cached_mtime_ns
+
+    personalities = load_personalities()
+
+    path = _route_path(route_id)
+    if op == "put":
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_json_file(path, _json_dumps(data))
+    else:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+    with _cache_lock:
+        if op == "put":
+            personalities[route_id] = data
+            _cached_models[route_id] = (
+                model if model is not None
+                else RoutePersonality.model_construct(**data)
+            )
+            _route_ids.add(route_id)
+        else:
+            personalities.pop(route_id, None)
+            _cached_models.pop(route_id, None)
+            _route_ids.discard(route_id)
+        _cached_personalities = personalities
+        _cached_mtime_ns = PERSONALITIES_DIR.stat().st_mtime_ns
+
+    return personalities
+
+
+def load_personality_models() -> Dict[str, "RoutePersonality"]:
+    """Return the cached validated models, refreshing from disk if stale."""
+    load_personalities()
+    return _cached_models
+
+
+def _current_etag() -> str:
+    """Weak ETag for the current personalities state.
+
+    The storage directory's mtime moves on every rename and unlink, so
+    each mutation produces a fresh tag.
+    """
+    load_personalities()
+    return f'W/"{_cached_mtime_ns}"'
+
+
+def _personality_exists(route_id: str) -> bool:
+    """O(1) existence check against the cached id set (refreshed if stale)."""
+    load_personalities()
+    return route_id in _route_ids
 
 
 def save_personalities(personalities: Dict[str, Dict[str, Any]]) -> None:
-    """Save personalities to JSON file."""
-    # Ensure data directory exists
-    PERSONALITIES_FILE.parent.mkdir(parents=True, exist_ok=True)
-    
-    with open(PERSONALITIES_FILE, 'w') as f:
-        json.dump(personalities, f, indent=2)
+    """Write the full personalities dict out as per-route files.
+
+    Routes absent from the dict have their files removed, so this doubles
+    as the restore path for bulk import.
+    """
+    global _cached_personalities, _cached_models, _route_ids, _cached_mtime_ns
+
+    PERSONALITIES_DIR.mkdir(parents=True, exist_ok=True)
+
+    for route_id, data in personalities.items():
+        _write_json_file(_route_path(route_id), _json_dumps(data))
+
+    with os.scandir(PERSONALITIES_DIR) as entries:
+        stale = [
+            entry.path for entry in entries
+            if entry.name.endswith('.json') and entry.name[:-5] not in personalities
+        ]
+    for path in stale:
+        os.unlink(path)
+
+    # Update the cache directly so the next read doesn't re-parse what
+    # we just wrote
+    with _cache_lock:
+        _cached_personalities = personalities
+        _cached_models = {
+            route_id: RoutePersonality.model_construct(**data)
+            for route_id, data in personalities.items()
+        }
+        _route_ids = set(personalities)
+        _cached_mtime_ns = PERSONALITIES_DIR.stat().st_mtime_ns
+
+
+# Static option pools, built once at import instead of per request
+_SOUND_DEVICES = (
+    "alliteration",
+    "assonance",
+    "consonance",
+    "end_rhyme",
+    "internal_rhyme",
+    "slant_rhyme",
+    "repetition",
+    "anaphora",
+    "onomatopoeia"
+)
+
+_THEMES = (
+    "urban_life",
+    "morning",
+    "evening",
+    "night",
+    "transition",
+    "isolation",
+    "hope",
+    "darkness",
+    "truth",
+    "labor",
+    "routine",
+    "peace",
+    "fatigue",
+    "memory"
+)
+
+_REBELLIOUS_MODES = (
+    {"value": None, "label": "None (Balanced)", "description": "Mix of canonical and fresh"},
+    {"value": "ignore", "label": "Ignore Canon", "description": "Use rare/underutilized elements"},
+    {"value": "invert", "label": "Invert Canon", "description": "Canonical themes with opposite treatment"},
+    {"value": "create_new", "label": "Create New", "description": "Pioneer unexplored territory"}
+)
 
 
 def get_available_sound_devices() -> List[str]:
     """Get list of available sound devices."""
-    return [
-        "alliteration",
-        "assonance",
-        "consonance",
-        "end_rhyme",
-        "internal_rhyme",
-        "slant_rhyme",
-        "repetition",
-        "anaphora",
-        "onomatopoeia"
-    ]
+    return list(_SOUND_DEVICES)
 
 
 def get_available_themes() -> List[str]:
     """Get list of common themes."""
-    return [
-        "urban_life",
-        "morning",
-        "evening",
-        "night",
-        "transition",
-        "isolation",
-        "hope",
-        "darkness",
-        "truth",
-        "labor",
-        "routine",
-        "peace",
-        "fatigue",
-        "memory"
-    ]
+    return list(_THEMES)
+
+
+# Options payloads are static - serialize them once at import time and hand
+# the bytes straight back from the endpoints
+_SOUND_DEVICE_OPTIONS_BYTES = _json_dumps({"sound_devices": list(_SOUND_DEVICES)})
+_THEME_OPTIONS_BYTES = _json_dumps({"themes": list(_THEMES)})
+_REBELLIOUS_MODE_OPTIONS_BYTES = _json_dumps({"modes": list(_REBELLIOUS_MODES)})
 
 
 # ==================== API ENDPOINTS ====================
@@ -178,8 +462,9 @@ async def get_available_routes():
     Get all available routes from GTFS data with human-friendly names.
     """
     try:
-        available_routes = load_available_routes()
-        existing_personalities = load_personalities()
+        # Offload blocking file reads so they don't stall the event loop
+        available_routes = await asyncio.to_thread(load_available_routes)
+        existing_personalities = await asyncio.to_thread(load_personalities)
         
         # Mark which routes already have personalities
         for route_id in available_routes:
@@ -196,36 +481,61 @@ async def get_available_routes():
             detail=f"Failed to load available routes: {e}"
         )
 
-@router.get("/", response_model=PersonalitiesResponse)
-async def list_personalities():
+# response_model is deliberately absent on the hot read/write endpoints
+# below: the data is already validated, and declaring it would make
+# FastAPI re-validate and re-serialize every response. OpenAPI schemas
+# are kept via the `responses` mapping instead.
+
+@router.get("/", responses={200: {"model": PersonalitiesResponse}})
+async def list_personalities(request: Request):
     """
     Get all route personalities.
     """
-    personalities = load_personalities()
-    
-    return PersonalitiesResponse(
-        personalities=personalities,
-        total=len(personalities)
+    personalities = await asyncio.to_thread(load_personalities)
+
+    # Let polling clients revalidate cheaply instead of re-downloading
+    etag = _current_etag()
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+
+    return _response_class(
+        {"personalities": personalities, "total": len(personalities)},
+        headers={"ETag": etag, "Cache-Control": "private, must-revalidate"},
     )
 
 
-@router.get("/{route_id}", response_model=RoutePersonality)
-async def get_personality(route_id: str):
+@router.get("/{route_id}", responses={200: {"model": RoutePersonality}})
+async def get_personality(route_id: str, request: Request):
     """
     Get a specific route's personality.
     """
-    personalities = load_personalities()
-    
-    if route_id not in personalities:
+    if not await asyncio.to_thread(_personality_exists, route_id):
+        raise HTTPException(
+            status_code=404,
+            detail=f"Route {route_id} not found"
+        )
+
+    etag = _current_etag()
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+
+    # Re-read under the lock: a concurrent DELETE between the existence
+    # check and here can pop the model from the cache
+    with _cache_lock:
+        model = _cached_models.get(route_id)
+    if model is None:
         raise HTTPException(
             status_code=404,
             detail=f"Route {route_id} not found"
         )
-    
-    return RoutePersonality(**personalities[route_id])
 
+    return _response_class(
+        model.model_dump(),
+        headers={"ETag": etag, "Cache-Control": "private, must-revalidate"},
+    )
 
-@router.put("/{route_id}", response_model=RoutePersonality)
+
+@router.put("/{route_id}", responses={200: {"model": RoutePersonality}})
 async def update_personality(
     route_id: str,
     request: UpdatePersonalityRequest
@@ -233,21 +543,21 @@ async def update_personality(
     """
     Update a route's personality.
     """
-    personalities = load_personalities()
-    
+    _require_route_id(route_id)
+
     # Convert Pydantic model to dict
     personality_dict = request.personality.model_dump()
-    
-    # Update
-    personalities[route_id] = personality_dict
-    
-    # Save
-    save_personalities(personalities)
-    
-    return request.personality
+
+    # Write just this route's file (O(1) write per mutation)
+    await asyncio.to_thread(
+        apply_personality_mutation, "put", route_id, personality_dict,
+        request.personality
+    )
+
+    return _response_class(personality_dict)
 
 
-@router.post("/{route_id}", response_model=RoutePersonality, status_code=201)
+@router.post("/{route_id}", responses={201: {"model": RoutePersonality}}, status_code=201)
 async def create_personality(
     route_id: str,
     request: UpdatePersonalityRequest
@@ -255,24 +565,24 @@ async def create_personality(
     """
     Create a new route personality.
     """
-    personalities = load_personalities()
-    
-    if route_id in personalities:
+    _require_route_id(route_id)
+
+    if await asyncio.to_thread(_personality_exists, route_id):
         raise HTTPException(
             status_code=400,
             detail=f"Route {route_id} already exists. Use PUT to update."
         )
-    
+
     # Convert Pydantic model to dict
     personality_dict = request.personality.model_dump()
-    
-    # Create
-    personalities[route_id] = personality_dict
-    
-    # Save
-    save_personalities(personalities)
-    
-    return request.personality
+
+    # Write just this route's file (O(1) write per mutation)
+    await asyncio.to_thread(
+        apply_personality_mutation, "put", route_id, personality_dict,
+        request.personality
+    )
+
+    return _response_class(personality_dict, status_code=201)
 
 
 @router.delete("/{route_id}")
@@ -280,17 +590,16 @@ async def delete_personality(route_id: str):
     """
     Delete a route's personality.
     """
-    personalities = load_personalities()
-    
-    if route_id not in personalities:
+    _require_route_id(route_id)
+
+    if not await asyncio.to_thread(_personality_exists, route_id):
         raise HTTPException(
             status_code=404,
             detail=f"Route {route_id} not found"
         )
-    
-    del personalities[route_id]
-    save_personalities(personalities)
-    
+
+    await asyncio.to_thread(apply_personality_mutation, "del", route_id)
+
     return {"message": f"Deleted personality for {route_id}"}
 
 
@@ -299,7 +608,7 @@ async def get_sound_device_options():
     """
     Get list of available sound devices for dropdowns.
     """
-    return {"sound_devices": get_available_sound_devices()}
+    return Response(_SOUND_DEVICE_OPTIONS_BYTES, media_type="application/json")
 
 
 @router.get("/options/themes")
@@ -307,7 +616,7 @@ async def get_theme_options():
     """
     Get list of available themes for dropdowns.
     """
-    return {"themes": get_available_themes()}
+    return Response(_THEME_OPTIONS_BYTES, media_type="application/json")
 
 
 @router.get("/options/rebellious-modes")
@@ -315,34 +624,50 @@ async def get_rebellious_mode_options():
     """
     Get list of available rebellious modes.
     """
-    return {
-        "modes": [
-            {"value": None, "label": "None (Balanced)", "description": "Mix of canonical and fresh"},
-            {"value": "ignore", "label": "Ignore Canon", "description": "Use rare/underutilized elements"},
-            {"value": "invert", "label": "Invert Canon", "description": "Canonical themes with opposite treatment"},
-            {"value": "create_new", "label": "Create New", "description": "Pioneer unexplored territory"}
-        ]
-    }
+    return Response(_REBELLIOUS_MODE_OPTIONS_BYTES, media_type="application/json")
 
 
 # ==================== BULK OPERATIONS ====================
 
 @router.post("/bulk/import")
-async def bulk_import_personalities(personalities: Dict[str, RoutePersonality]):
+async def bulk_import_personalities(request: Request):
     """
     Import multiple personalities at once.
     Useful for seeding or restoring from backup.
+
+    Parses the body directly instead of declaring Dict[str, RoutePersonality],
+    which would make FastAPI validate every entry of a potentially large
+    restore; every entry is then validated here before any file is
+    written, since one malformed value on disk would poison every
+    subsequent load.
     """
-    existing = load_personalities()
-    
-    # Convert all to dicts
-    for route_id, personality in personalities.items():
-        if isinstance(personality, RoutePersonality):
-            existing[route_id] = personality.model_dump()
-        else:
-            existing[route_id] = personality
-    
-    save_personalities(existing)
+    try:
+        personalities = _json_loads(await request.body())
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Request body is not valid JSON")
+
+    if not isinstance(personalities, dict):
+        raise HTTPException(
+            status_code=400,
+            detail="Expected a JSON object mapping route ids to personalities"
+        )
+
+    # Every key becomes a file name and every value a file body, so vet
+    # them all before any write
+    for route_id, value in personalities.items():
+        _require_route_id(route_id)
+        try:
+            RoutePersonality.model_validate(value)
+        except ValidationError as e:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Invalid personality for route {route_id}: {e}"
+            )
+
+    existing = await asyncio.to_thread(load_personalities)
+    existing.update(personalities)
+
+    await asyncio.to_thread(save_personalities, existing)
     
     return {
         "message": f"Imported {len(personalities)} personalities",
@@ -350,16 +675,71 @@ async def bulk_import_personalities(personalities: Dict[str, RoutePersonality]):
     }
 
 
+def _export_bytes() -> bytes:
+    """Serialize the full personalities dict once in the aggregate format."""
+    personalities = load_personalities()
+    if orjson is not None:
+        return orjson.dumps(personalities, option=orjson.OPT_INDENT_2)
+    return json.dumps(personalities, indent=2).encode('utf-8')
+
+
+@router.post("/bulk/update")
+async def bulk_update_personalities(personalities: Dict[str, RoutePersonality]):
+    """
+    Update multiple personalities in one request.
+
+    Applies every update to the in-memory state and writes the file once,
+    instead of paying a save per route like repeated single PUTs would.
+    """
+    for route_id in personalities:
+        _require_route_id(route_id)
+
+    existing = await asyncio.to_thread(load_personalities)
+    existing.update(
+        {route_id: p.model_dump() for route_id, p in personalities.items()}
+    )
+    await asyncio.to_thread(save_personalities, existing)
+
+    return {
+        "message": f"Updated {len(personalities)} personalities",
+        "total": len(existing)
+    }
+
+
 @router.get("/bulk/export")
-async def bulk_export_personalities():
+async def bulk_export_personalities(request: Request):
     """
     Export all personalities for backup.
     """
-    return load_personalities()
+    etag = await asyncio.to_thread(_current_etag)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+
+    # Hand the JSON bytes straight back instead of letting FastAPI
+    # re-encode a dict it just parsed from the same file
+    content = await asyncio.to_thread(_export_bytes)
+    return Response(
+        content,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": "private, must-revalidate"},
+    )
 
 
 # ==================== VALIDATION ====================
 
+def _over_threshold(values: Dict[str, float], threshold: float) -> bool:
+    """True once a running sum of the values exceeds the threshold.
+
+    Stops iterating as soon as the threshold is crossed, so well-formed
+    dicts (the common case) are the only ones walked in full.
+    """
+    total = 0.0
+    for v in values.values():
+        total += v
+        if total > threshold:
+            return True
+    return False
+
 @router.post("/{route_id}/validate")
 async def validate_personality(route_id: str, personality: RoutePersonality):
     """
@@ -375,16 +755,14 @@ async def validate_personality(route_id: str, personality: RoutePersonality):
         )
     
     # Check if preferences sum makes sense
-    total_sound_pref = sum(personality.sound_preferences.values())
-    if total_sound_pref > 5.0:
+    if _over_threshold(personality.sound_preferences, 5.0):
         warnings.append(
-            f"Sound preferences sum to {total_sound_pref:.1f} - consider normalizing"
+            "Sound preferences sum to more than 5.0 - consider normalizing"
         )
-    
-    total_theme_aff = sum(personality.theme_affinities.values())
-    if total_theme_aff > 5.0:
+
+    if _over_threshold(personality.theme_affinities, 5.0):
         warnings.append(
-            f"Theme affinities sum to {total_theme_aff:.1f} - consider normalizing"
+            "Theme affinities sum to more than 5.0 - consider normalizing"
         )
     
     # Check for extreme values
@@ -406,18 +784,20 @@ async def validate_personality(route_id: str, personality: RoutePersonality):
     }
 
 
+# Declarative rebellious_mode -> type mapping; one hash lookup replaces
+# the old elif chain and new modes only need a table entry
+_TYPE_BY_MODE = {
+    "invert": "Contrarian",
+    "ignore": "Explorer",
+    "create_new": "Pioneer",
+}
+
+
 def _get_personality_type(personality: RoutePersonality) -> str:
     """Classify personality type for UI."""
     if personality.loyalty_to_canon > 0.8:
         return "Traditionalist"
-    elif personality.rebellious_mode == "invert":
-        return "Contrarian"
-    elif personality.rebellious_mode == "ignore":
-        return "Explorer"
-    elif personality.rebellious_mode == "create_new":
-        return "Pioneer"
-    else:
-        return "Balanced"
+    return _TYPE_BY_MODE.get(personality.rebellious_mode, "Balanced")
 
 
 @router.get("/test-routes")
@@ -10,11 +10,93 @@ The prompt builder translates route personality into specific creative constrain
 derived from the knowledge graph.
 """
 
-from typing import Dict, List, Any, Optional
+import heapq
+import string
+from dataclasses import dataclass, field
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from poetry.graph import ExtendedPoetryGraph
 import json
 from pathlib import Path
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+@dataclass(frozen=True)
+class PersonalityView:
+    """Pre-sorted views of a personality's preference dicts.
+
+    Several constraint builders want the top-N sounds or themes; sorting
+    once here lets them all slice the same tuples instead of re-sorting
+    per builder.
+    """
+    sorted_sounds: Tuple[Tuple[str, float], ...]
+    sorted_themes: Tuple[Tuple[str, float], ...]
+
+    @classmethod
+    def from_personality(cls, personality: Dict[str, Any]) -> "PersonalityView":
+        return cls(
+            sorted_sounds=tuple(sorted(
+                personality.get("sound_preferences", {}).items(),
+                key=itemgetter(1), reverse=True
+            )),
+            sorted_themes=tuple(sorted(
+                personality.get("theme_affinities", {}).items(),
+                key=itemgetter(1), reverse=True
+            )),
+        )
+
+
+@dataclass(slots=True)
+class ConstraintSet:
+    """Creative constraints produced by the builders.
+
+    A slotted dataclass instead of a dict: the field set is fixed, the
+    formatter reads it by attribute, and slots avoid a per-instance
+    __dict__ on the prompt hot path.
+    """
+    themes: List[str]
+    sound_devices: List[str]
+    approach: str
+    rationale: str
+    structure: Dict[str, Any] = field(default_factory=dict)
+    theme_sound_pairs: Dict[str, int] = field(default_factory=dict)
+    inverse_emotions: List[str] = field(default_factory=list)
+    unexplored_imagery: List[str] = field(default_factory=list)
+    avoid: Optional[str] = None
+    encourage_new: bool = False
+
+
+# Static prompt skeleton, parsed once at import instead of re-interpolating
+# a triple-quoted f-string on every assembly
+_PROMPT_TEMPLATE = string.Template("""You are writing a poem for $route_name.
+
+Route Character:
+$route_description
+
+Relationship to The Homunculus (the poetry canon):
+- Loyalty to canon: $loyalty
+- Strategy: $strategy
+- $rationale
+
+Creative Constraints from the Knowledge Graph:
+$constraint_text$context_text
+
+Voice Guidelines:
+- Write in free verse (no formal meter or rhyme scheme)
+- Length: 8-16 lines
+- Create a distinctive voice for this route
+- Do not reference MARTA, trains, or transportation directly
+- Routes should not reference themselves
+- Vary point of view and tone based on context. Avoid use of first person unless fitting.
+- $loyalty_guideline
+
+Write the poem now:""")
+
 
 class PromptBuilder:
     """
@@ -25,7 +107,17 @@ class PromptBuilder:
     - Rebellious routes (low loyalty): Subvert, invert, or create new patterns
     - Mode-specific behaviors: ignore, invert, create_new
     """
-    
+
+    # One builder per live graph instance, so the version-keyed query
+    # cache amortizes across callers instead of starting cold every time
+    # a handler constructs its own builder
+    _instances: Dict[int, "PromptBuilder"] = {}
+
+    @classmethod
+    def get(cls, graph: ExtendedPoetryGraph) -> "PromptBuilder":
+        """Return the shared builder for a graph, creating it on first use."""
+        return cls._instances.setdefault(id(graph), cls(graph))
+
     def __init__(self, graph: ExtendedPoetryGraph):
         """
         Initialize prompt builder with access to the knowledge graph.
@@ -34,7 +126,26 @@ class PromptBuilder:
             graph: The poetry knowledge graph instance
         """
         self.graph = graph
-    
+        # Memoized graph query results, valid for one graph version: a
+        # generation batch asks the same canonical/rare/unexplored
+        # questions once per route, but the answers only change when the
+        # graph itself does
+        self._query_cache: Dict[tuple, Any] = {}
+        self._query_cache_version: int = -1
+
+    def _graph_query(self, method: str, *args: Any) -> Any:
+        """Call a graph accessor, reusing the result until the graph mutates."""
+        version = getattr(self.graph, "_version", -1)
+        if version != self._query_cache_version:
+            self._query_cache.clear()
+            self._query_cache_version = version
+
+        key = (method, args)
+        if key not in self._query_cache:
+            self._query_cache[key] = getattr(self.graph, method)(*args)
+        return self._query_cache[key]
+
+
     def build_prompt_for_route(
         self,
         route_id: str,
@@ -55,30 +166,33 @@ class PromptBuilder:
         # Step 1: Determine creative strategy based on personality
         loyalty = personality.get("loyalty_to_canon", 0.5)
         rebellious_mode = personality.get("rebellious_mode")
-        
+
+        # Sort the preference dicts once; every builder slices these
+        view = PersonalityView.from_personality(personality)
+
         if loyalty > 0.7:
             # High loyalty - use canonical patterns
             constraints = self._build_loyal_constraints(personality)
             strategy = "following established patterns"
-            
+
         elif rebellious_mode == "ignore":
             # Ignore canon - use rare/unexplored elements
-            constraints = self._build_ignore_constraints(personality)
+            constraints = self._build_ignore_constraints(personality, view)
             strategy = "exploring underutilized territory"
-            
+
         elif rebellious_mode == "invert":
             # Invert canon - take canonical themes but flip associated elements
-            constraints = self._build_invert_constraints(personality)
+            constraints = self._build_invert_constraints(personality, view)
             strategy = "subverting expectations"
-            
+
         elif rebellious_mode == "create_new":
             # Create new - find entirely unexplored combinations
             constraints = self._build_create_new_constraints(personality)
             strategy = "pioneering new ground"
-            
+
         else:
             # Moderate/balanced approach
-            constraints = self._build_balanced_constraints(personality)
+            constraints = self._build_balanced_constraints(personality, view)
             strategy = "balancing tradition and innovation"
         
         # Step 2: Build the complete prompt
@@ -91,21 +205,119 @@ class PromptBuilder:
         )
         
         return prompt
-    
+
+    def build_prompts_batch(
+        self,
+        items: List[Tuple[str, Dict[str, Any], Optional[Dict[str, Any]]]]
+    ) -> List[str]:
+        """
+        Build prompts for many routes in one pass.
+
+        Warms the graph queries every constraint builder shares before the
+        loop, so a snapshot across all routes traverses the graph once and
+        each per-route build only does personality-specific selection.
+
+        Args:
+            items: (route_id, personality, context) tuples
+
+        Returns:
+            Prompt strings in the same order as items
+        """
+        if not items:
+            return []
+
+        # Shared state first: these answers are identical for every route
+        # in the batch and _graph_query pins them for the current graph
+        # version, so the per-item builds below are cache hits
+        self._graph_query("get_canonical_themes", 3)
+        self._graph_query("get_canonical_sound_devices", 2)
+        self.graph.average_structure  # version-cached on the graph
+
+        modes = {p.get("rebellious_mode") for _, p, _ in items
+                 if p.get("loyalty_to_canon", 0.5) <= 0.7}
+        if "ignore" in modes:
+            self._graph_query("get_rare_themes", 2)
+            self._graph_query("get_rare_sound_devices", 1)
+        if "create_new" in modes:
+            self._graph_query("get_unexplored_combinations", "theme", "sound_device", 10)
+            self._graph_query("get_unexplored_combinations", "theme", "imagery", 10)
+        if None in modes:
+            self._graph_query("get_unexplored_combinations", "theme", "sound_device", 5)
+
+        return [
+            self.build_prompt_for_route(route_id, personality, context)
+            for route_id, personality, context in items
+        ]
+
+    def compile_for_route(
+        self,
+        route_id: str,
+        personality: Dict[str, Any]
+    ) -> Callable[[Optional[Dict[str, Any]]], str]:
+        """
+        Specialize the prompt pipeline for one route.
+
+        The loyalty/rebellious-mode dispatch, strategy string, and sorted
+        personality views only depend on the personality, so resolve them
+        once here and return a closure that just runs the chosen constraint
+        builder and assembles. Agents that generate repeatedly for the same
+        route call the closure instead of re-dispatching every time.
+
+        Args:
+            route_id: MARTA route identifier (e.g., "MARTA_5")
+            personality: Route personality config
+
+        Returns:
+            Callable taking an optional context dict and returning the prompt
+        """
+        loyalty = personality.get("loyalty_to_canon", 0.5)
+        rebellious_mode = personality.get("rebellious_mode")
+        view = PersonalityView.from_personality(personality)
+
+        if loyalty > 0.7:
+            build = lambda: self._build_loyal_constraints(personality)
+            strategy = "following established patterns"
+        elif rebellious_mode == "ignore":
+            build = lambda: self._build_ignore_constraints(personality, view)
+            strategy = "exploring underutilized territory"
+        elif rebellious_mode == "invert":
+            build = lambda: self._build_invert_constraints(personality, view)
+            strategy = "subverting expectations"
+        elif rebellious_mode == "create_new":
+            build = lambda: self._build_create_new_constraints(personality)
+            strategy = "pioneering new ground"
+        else:
+            build = lambda: self._build_balanced_constraints(personality, view)
+            strategy = "balancing tradition and innovation"
+
+        def prompt_fn(context: Optional[Dict[str, Any]] = None) -> str:
+            # Constraints still go through the builder so graph mutations
+            # are picked up; _graph_query memoizes within a graph version
+            return self._assemble_prompt(
+                route_id=route_id,
+                personality=personality,
+                constraints=build(),
+                strategy=strategy,
+                context=context
+            )
+
+        return prompt_fn
+
     # ==================== CONSTRAINT BUILDERS ====================
     
-    def _build_loyal_constraints(self, personality: Dict[str, Any]) -> Dict[str, Any]:
+    def _build_loyal_constraints(self, personality: Dict[str, Any]) -> ConstraintSet:
         """
         Build constraints for loyal routes (high canon adherence).
         Uses canonical patterns from the graph.
         """
         # Get canonical patterns
-        canonical_themes = self.graph.get_canonical_themes(min_frequency=3)
-        canonical_sounds = self.graph.get_canonical_sound_devices(min_frequency=2)
+        canonical_themes = self._graph_query("get_canonical_themes", 3)
+        canonical_sounds = self._graph_query("get_canonical_sound_devices", 2)
         
-        # Filter by route preferences if available
-        theme_affinities = personality.get("theme_affinities", {})
-        sound_preferences = personality.get("sound_preferences", {})
+        # Filter by route preferences; personalities are normalized at
+        # load time so these keys always exist
+        theme_affinities = personality["theme_affinities"]
+        sound_preferences = personality["sound_preferences"]
         
         # Select themes: prioritize route affinities + canonical
         selected_themes = self._select_with_affinity(
@@ -123,104 +335,92 @@ class PromptBuilder:
         
         # Get common co-occurrences for coherence
         if selected_themes:
-            theme_sound_pairs = self.graph.get_sound_device_co_occurrence_with_theme(
+            theme_sound_pairs = self._graph_query(
+                "get_sound_device_co_occurrence_with_theme",
                 selected_themes[0]["name"]
             )
         else:
             theme_sound_pairs = {}
-        
-        # Get structural patterns from similar routes
-        route_stats = self.graph.get_all_routes_statistics()
-        similar_routes = [
-            r for r in route_stats 
-            if r.get("poem_count", 0) > 2  # Routes with enough history
-        ]
-        
-        if similar_routes:
-            avg_structure = {
-                "avg_line_count": sum(
-                    r.get("structure_metrics", {}).get("avg_line_count", 12) 
-                    for r in similar_routes
-                ) / len(similar_routes),
-                "common_stanza_pattern": [4, 4, 4]  # Default quatrain pattern
-            }
-        else:
-            avg_structure = {
-                "avg_line_count": 12,
-                "common_stanza_pattern": [4, 4, 4]
-            }
-        
-        return {
-            "themes": [t["name"] for t in selected_themes],
-            "sound_devices": [s["name"] for s in selected_sounds],
-            "theme_sound_pairs": theme_sound_pairs,
-            "structure": avg_structure,
-            "approach": "canonical",
-            "rationale": f"Following established patterns with {', '.join([t['name'] for t in selected_themes[:2]])} themes"
-        }
+
+        # Structural guidance comes precomputed from the graph, cached
+        # against its version, so loyal builds skip the per-route reduction
+        avg_structure = self.graph.average_structure
+
+        return ConstraintSet(
+            themes=[t["name"] for t in selected_themes],
+            sound_devices=[s["name"] for s in selected_sounds],
+            theme_sound_pairs=theme_sound_pairs,
+            structure=avg_structure,
+            approach="canonical",
+            rationale=f"Following established patterns with {', '.join([t['name'] for t in selected_themes[:2]])} themes"
+        )
     
-    def _build_ignore_constraints(self, personality: Dict[str, Any]) -> Dict[str, Any]:
+    def _build_ignore_constraints(
+        self,
+        personality: Dict[str, Any],
+        view: PersonalityView
+    ) -> ConstraintSet:
         """
         Build constraints for rebellious routes in 'ignore' mode.
         Uses rare/underutilized elements.
         """
         # Get rare elements
-        rare_themes = self.graph.get_rare_themes(max_frequency=2)
-        rare_sounds = self.graph.get_rare_sound_devices(max_frequency=1)
-        
-        # Still respect route preferences if strong
-        sound_preferences = personality.get("sound_preferences", {})
-        theme_affinities = personality.get("theme_affinities", {})
-        
+        rare_themes = self._graph_query("get_rare_themes", 2)
+        rare_sounds = self._graph_query("get_rare_sound_devices", 1)
+
         # Mix: some rare + some preferred
         selected_themes = []
         if rare_themes:
             selected_themes.append(rare_themes[0])  # At least one rare
-        
+
         # Add preferred themes even if not canonical
-        for theme, affinity in sorted(theme_affinities.items(), key=lambda x: x[1], reverse=True)[:2]:
+        for theme, affinity in view.sorted_themes[:2]:
             selected_themes.append({"name": theme})
-        
+
         # Sound devices: prioritize preferences over rarity
         selected_sounds = []
-        for sound, preference in sorted(sound_preferences.items(), key=lambda x: x[1], reverse=True)[:2]:
+        for sound, preference in view.sorted_sounds[:2]:
             selected_sounds.append({"name": sound})
         
         # If no preferences, use rare sounds
         if not selected_sounds and rare_sounds:
             selected_sounds = rare_sounds[:2]
         
-        return {
-            "themes": [t["name"] for t in selected_themes[:3]],
-            "sound_devices": [s["name"] for s in selected_sounds],
-            "avoid": "canonical patterns",
-            "structure": {
+        return ConstraintSet(
+            themes=[t["name"] for t in selected_themes[:3]],
+            sound_devices=[s["name"] for s in selected_sounds],
+            avoid="canonical patterns",
+            structure={
                 "vary_from_norm": True,
                 "experimental": True
             },
-            "approach": "ignore_canon",
-            "rationale": f"Exploring underutilized territory with rare themes and sounds"
-        }
+            approach="ignore_canon",
+            rationale="Exploring underutilized territory with rare themes and sounds"
+        )
     
-    def _build_invert_constraints(self, personality: Dict[str, Any]) -> Dict[str, Any]:
+    def _build_invert_constraints(
+        self,
+        personality: Dict[str, Any],
+        view: PersonalityView
+    ) -> ConstraintSet:
         """
         Build constraints for rebellious routes in 'invert' mode.
         Takes canonical themes but pairs with opposite/unexpected elements.
         """
         # Get canonical theme
-        canonical_themes = self.graph.get_canonical_themes(min_frequency=3)
-        
+        canonical_themes = self._graph_query("get_canonical_themes", 3)
+
         if not canonical_themes:
             # No canon yet, default to balanced
-            return self._build_balanced_constraints(personality)
+            return self._build_balanced_constraints(personality, view)
         
         # Pick the most canonical theme
         primary_theme = canonical_themes[0]
         theme_id = primary_theme["id"]
         
         # Find what HASN'T been used with this theme
-        inverse_sounds = self.graph.get_inverse_pattern(theme_id, "sound_device")
-        inverse_emotions = self.graph.get_inverse_pattern(theme_id, "emotion")
+        inverse_sounds = self._graph_query("get_inverse_pattern", theme_id, "sound_device")
+        inverse_emotions = self._graph_query("get_inverse_pattern", theme_id, "emotion")
         
         # Build unexpected combinations
         selected_sounds = []
@@ -228,42 +428,42 @@ class PromptBuilder:
             selected_sounds = [inverse_sounds[0]]  # Most common unused sound
         
         # Add route-preferred sounds that are also inversions
-        sound_preferences = personality.get("sound_preferences", {})
+        sound_preferences = personality["sound_preferences"]
         for sound_obj in inverse_sounds[1:]:
             if sound_obj["name"] in sound_preferences:
                 selected_sounds.append(sound_obj)
                 break
         
-        return {
-            "themes": [primary_theme["name"]],  # Canonical theme
-            "sound_devices": [s["name"] for s in selected_sounds[:2]],
-            "inverse_emotions": [e["name"] for e in inverse_emotions[:2]],
-            "structure": {
+        return ConstraintSet(
+            themes=[primary_theme["name"]],  # Canonical theme
+            sound_devices=[s["name"] for s in selected_sounds[:2]],
+            inverse_emotions=[e["name"] for e in inverse_emotions[:2]],
+            structure={
                 "contrast_with_norm": True
             },
-            "approach": "invert_canon",
-            "rationale": f"Using canonical theme '{primary_theme['name']}' with unexpected sound devices to create contrast"
-        }
+            approach="invert_canon",
+            rationale=f"Using canonical theme '{primary_theme['name']}' with unexpected sound devices to create contrast"
+        )
     
-    def _build_create_new_constraints(self, personality: Dict[str, Any]) -> Dict[str, Any]:
+    def _build_create_new_constraints(self, personality: Dict[str, Any]) -> ConstraintSet:
         """
         Build constraints for rebellious routes in 'create_new' mode.
         Finds entirely unexplored combinations.
         """
         # Find unexplored theme + sound device combinations
-        unexplored_combos = self.graph.get_unexplored_combinations(
-            "theme", "sound_device", limit=10
+        unexplored_combos = self._graph_query(
+            "get_unexplored_combinations", "theme", "sound_device", 10
         )
-        
+
         # Find unexplored theme + imagery combinations
-        unexplored_imagery = self.graph.get_unexplored_combinations(
-            "theme", "imagery", limit=10
+        unexplored_imagery = self._graph_query(
+            "get_unexplored_combinations", "theme", "imagery", 10
         )
         
         if unexplored_combos:
             # Pick combinations that align with route preferences
-            sound_preferences = personality.get("sound_preferences", {})
-            theme_affinities = personality.get("theme_affinities", {})
+            sound_preferences = personality["sound_preferences"]
+            theme_affinities = personality["theme_affinities"]
             
             best_combo = unexplored_combos[0]
             for combo in unexplored_combos:
@@ -282,29 +482,33 @@ class PromptBuilder:
             selected_themes = ["(introduce new theme)"]
             selected_sounds = ["(introduce new sound device)"]
         
-        return {
-            "themes": selected_themes,
-            "sound_devices": selected_sounds,
-            "unexplored_imagery": [u["imagery"] for u in unexplored_imagery[:3]],
-            "encourage_new": True,
-            "structure": {
+        return ConstraintSet(
+            themes=selected_themes,
+            sound_devices=selected_sounds,
+            unexplored_imagery=[u["imagery"] for u in unexplored_imagery[:3]],
+            encourage_new=True,
+            structure={
                 "experimental": True,
                 "break_conventions": True
             },
-            "approach": "create_new",
-            "rationale": f"Pioneering unexplored combination: {selected_themes[0]} with {selected_sounds[0]}"
-        }
+            approach="create_new",
+            rationale=f"Pioneering unexplored combination: {selected_themes[0]} with {selected_sounds[0]}"
+        )
     
-    def _build_balanced_constraints(self, personality: Dict[str, Any]) -> Dict[str, Any]:
+    def _build_balanced_constraints(
+        self,
+        personality: Dict[str, Any],
+        view: PersonalityView
+    ) -> ConstraintSet:
         """
         Build constraints for moderate routes.
         Mix of canonical and fresh elements.
         """
         # Get some canonical
-        canonical_themes = self.graph.get_canonical_themes(min_frequency=2)
-        
+        canonical_themes = self._graph_query("get_canonical_themes", 2)
+
         # Get some fresh
-        unexplored = self.graph.get_unexplored_combinations("theme", "sound_device", limit=5)
+        unexplored = self._graph_query("get_unexplored_combinations", "theme", "sound_device", 5)
         
         # Mix them
         themes = []
@@ -314,15 +518,14 @@ class PromptBuilder:
             themes.append(unexplored[0]["theme"])  # One fresh
         
         # Sound devices from preferences
-        sound_preferences = personality.get("sound_preferences", {})
-        selected_sounds = sorted(sound_preferences.items(), key=lambda x: x[1], reverse=True)[:2]
+        selected_sounds = view.sorted_sounds[:2]
         
-        return {
-            "themes": themes,
-            "sound_devices": [s[0] for s in selected_sounds],
-            "approach": "balanced",
-            "rationale": "Balancing established patterns with fresh exploration"
-        }
+        return ConstraintSet(
+            themes=themes,
+            sound_devices=[s[0] for s in selected_sounds],
+            approach="balanced",
+            rationale="Balancing established patterns with fresh exploration"
+        )
     
     # ==================== HELPER METHODS ====================
     
@@ -345,20 +548,21 @@ class PromptBuilder:
         """
         if not items:
             return []
+
+        # Score each item: affinity (if present) + normalized usage
+        # frequency. Bound-method hoist plus a single comprehension keeps
+        # the interpreter work per candidate to a minimum.
+        affinity = affinities.get
+        scored_items = [
+            (affinity(item["name"], 0.0) + item.get("usage_count", 0) * 0.1, item)
+            for item in items
+        ]
         
-        # Score each item: affinity (if present) + usage frequency
-        scored_items = []
-        for item in items:
-            name = item["name"]
-            affinity_score = affinities.get(name, 0.0)
-            frequency_score = item.get("usage_count", 0) / 10  # Normalize
-            total_score = affinity_score + frequency_score
-            
-            scored_items.append((total_score, item))
-        
-        # Sort by score and return top N
-        scored_items.sort(key=lambda x: x[0], reverse=True)
-        return [item for score, item in scored_items[:count]]
+        # Top N by score: nlargest is O(N log k) vs a full O(N log N) sort
+        return [
+            item for score, item in
+            heapq.nlargest(count, scored_items, key=itemgetter(0))
+        ]
     
     # ==================== PROMPT ASSEMBLY ====================
     
@@ -366,7 +570,7 @@ class PromptBuilder:
         self,
         route_id: str,
         personality: Dict[str, Any],
-        constraints: Dict[str, Any],
+        constraints: ConstraintSet,
         strategy: str,
         context: Optional[Dict[str, Any]] = None
     ) -> str:
@@ -393,115 +597,138 @@ class PromptBuilder:
             if context_parts:
                 context_text = f"\n\nCurrent Context:\n" + "\n".join(f"- {p}" for p in context_parts)
         
-        # Assemble complete prompt
-        prompt = f"""You are writing a poem for {route_name}.
-
-Route Character:
-{route_description}
-
-Relationship to The Homunculus (the poetry canon):
-- Loyalty to canon: {personality.get('loyalty_to_canon', 0.5):.0%}
-- Strategy: {strategy}
-- {constraints.get('rationale', 'Creating distinctive voice')}
-
-Creative Constraints from the Knowledge Graph:
-{constraint_text}{context_text}
-
-Voice Guidelines:
-- Write in free verse (no formal meter or rhyme scheme)
-- Length: 8-16 lines
-- Create a distinctive voice for this route
-- Do not reference MARTA, trains, or transportation directly
-- Routes should not reference themselves
-- Vary point of view and tone based on context. Avoid use of first person unless fitting.
-- {"Stay true to established patterns" if personality.get('loyalty_to_canon', 0.5) > 0.7 else "Feel free to break conventions"}
-
-Write the poem now:"""
-        
-        return prompt
+        # Assemble complete prompt from the precompiled template
+        loyalty = personality.get('loyalty_to_canon', 0.5)
+        return _PROMPT_TEMPLATE.substitute(
+            route_name=route_name,
+            route_description=route_description,
+            loyalty=f"{loyalty:.0%}",
+            strategy=strategy,
+            rationale=constraints.rationale or 'Creating distinctive voice',
+            constraint_text=constraint_text,
+            context_text=context_text,
+            loyalty_guideline=(
+                "Stay true to established patterns" if loyalty > 0.7
+                else "Feel free to break conventions"
+            ),
+        )
     
-    def _format_constraints(self, constraints: Dict[str, Any]) -> str:
+    def _format_constraints(self, constraints: ConstraintSet) -> str:
         """Format constraints into readable prompt text."""
         lines = []
-        
+
         # Themes
-        if constraints.get("themes"):
-            themes_str = ", ".join(constraints["themes"])
-            lines.append(f"- Themes: {themes_str}")
-        
+        if constraints.themes:
+            lines.append(f"- Themes: {', '.join(constraints.themes)}")
+
         # Sound devices
-        if constraints.get("sound_devices"):
-            sounds_str = ", ".join(constraints["sound_devices"])
-            lines.append(f"- Sound devices: {sounds_str}")
-        
+        if constraints.sound_devices:
+            lines.append(f"- Sound devices: {', '.join(constraints.sound_devices)}")
+
         # Inverse emotions (for invert mode)
-        if constraints.get("inverse_emotions"):
-            emotions_str = ", ".join(constraints["inverse_emotions"])
-            lines.append(f"- Emotions (unexpected pairing): {emotions_str}")
-        
+        if constraints.inverse_emotions:
+            lines.append(f"- Emotions (unexpected pairing): {', '.join(constraints.inverse_emotions)}")
+
         # Unexplored imagery (for create_new mode)
-        if constraints.get("unexplored_imagery"):
-            imagery_str = ", ".join(constraints["unexplored_imagery"])
-            lines.append(f"- Fresh imagery to explore: {imagery_str}")
-        
+        if constraints.unexplored_imagery:
+            lines.append(f"- Fresh imagery to explore: {', '.join(constraints.unexplored_imagery)}")
+
         # What to avoid (for ignore mode)
-        if constraints.get("avoid"):
-            lines.append(f"- Avoid: {constraints['avoid']}")
-        
+        if constraints.avoid:
+            lines.append(f"- Avoid: {constraints.avoid}")
+
         # Structural guidance
-        structure = constraints.get("structure", {})
+        structure = constraints.structure
         if structure.get("avg_line_count"):
             lines.append(f"- Typical length: ~{structure['avg_line_count']:.0f} lines")
-        
+
         if structure.get("experimental"):
             lines.append("- Experiment with structure (vary line lengths, unexpected breaks)")
         elif structure.get("vary_from_norm"):
             lines.append("- Structure: vary from typical patterns")
         elif structure.get("contrast_with_norm"):
             lines.append("- Structure: contrast with canonical forms")
-        
-        if constraints.get("encourage_new"):
+
+        if constraints.encourage_new:
             lines.append("- Feel free to introduce entirely new themes or imagery")
-        
+
         return "\n".join(lines) if lines else "- No specific constraints (pure creative freedom)"
 
 
 # ==================== UTILITY FUNCTIONS ====================
 
+# Parsed personality files keyed by their mtime, so repeated lookups
+# skip the disk read and re-parse when nothing changed. Per-route files
+# (the canonical storage the personality API writes) are cached per
+# route; the legacy aggregate file keeps its single cache entry for
+# trees that have not been migrated yet.
+_PERSONALITY_CACHE: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+_AGGREGATE_CACHE: Optional[Tuple[int, Dict[str, Any]]] = None
+
+
+def _default_personality(route_id: str) -> Dict[str, Any]:
+    return {
+        "name": route_id,
+        "description": "A MARTA route finding its voice",
+        "loyalty_to_canon": 0.5,
+        "rebellious_mode": None,
+        "sound_preferences": {},
+        "theme_affinities": {}
+    }
+
+
+def _normalize_personality(personality: Dict[str, Any]) -> Dict[str, Any]:
+    # Normalize once at parse time so the constraint builders can use
+    # plain indexing instead of .get() with a fresh default dict on
+    # every call
+    personality.setdefault("sound_preferences", {})
+    personality.setdefault("theme_affinities", {})
+    personality.setdefault("rebellious_mode", None)
+    return personality
+
+
 def load_route_personality(route_id: str) -> Dict[str, Any]:
     """
     Load personality configuration for a route.
-    
+
+    Reads the per-route file under data/route_personalities/ that the
+    personality API maintains, falling back to the legacy aggregate
+    route_personalities.json for unmigrated installs.
+
     Args:
         route_id: Route identifier (e.g., "MARTA_5")
-    
+
     Returns:
         Personality configuration dict
     """
+    global _AGGREGATE_CACHE
+
+    route_path = Path("data/route_personalities") / f"{route_id}.json"
+    try:
+        mtime_ns = route_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        pass
+    else:
+        cached = _PERSONALITY_CACHE.get(route_id)
+        if cached is None or cached[0] != mtime_ns:
+            personality = _normalize_personality(_loads(route_path.read_bytes()))
+            _PERSONALITY_CACHE[route_id] = cached = (mtime_ns, personality)
+        return cached[1]
+
     config_path = Path("data/route_personalities.json")
-    
-    if not config_path.exists():
+    try:
+        mtime_ns = config_path.stat().st_mtime_ns
+    except FileNotFoundError:
         # Return default personality
-        return {
-            "name": route_id,
-            "description": "A MARTA route finding its voice",
-            "loyalty_to_canon": 0.5,
-            "rebellious_mode": None,
-            "sound_preferences": {},
-            "theme_affinities": {}
-        }
-    
-    with open(config_path) as f:
-        personalities = json.load(f)
-    
-    return personalities.get(route_id, {
-        "name": route_id,
-        "description": "A MARTA route finding its voice",
-        "loyalty_to_canon": 0.5,
-        "rebellious_mode": None,
-        "sound_preferences": {},
-        "theme_affinities": {}
-    })
+        return _default_personality(route_id)
+
+    if _AGGREGATE_CACHE is None or _AGGREGATE_CACHE[0] != mtime_ns:
+        personalities = _loads(config_path.read_bytes())
+        for p in personalities.values():
+            _normalize_personality(p)
+        _AGGREGATE_CACHE = (mtime_ns, personalities)
+
+    return _AGGREGATE_CACHE[1].get(route_id, _default_personality(route_id))
 
 
 # ==================== EXAMPLE USAGE ====================
@@ -1,10 +1,20 @@
+import atexit
+import collections
+import functools
+import hashlib
+import io
+import json
+import logging
 import random
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
 from .character_agent import get_route_personality
 from .narrative_engine import apply_story_influence
 from .prompt_builder import build_poetry_prompt
 from storage.poem_store import PoemStore
-from openai import AzureOpenAI
+from openai import AzureOpenAI, AsyncAzureOpenAI
 from config import AZURE_OPENAI_API_KEY, AZURE_OPENAI_ENDPOINT, AZURE_OPENAI_DEPLOYMENT_NAME, AZURE_OPENAI_API_VERSION
 
 endpoint = AZURE_OPENAI_ENDPOINT
@@ -13,19 +23,104 @@ deployment = AZURE_OPENAI_DEPLOYMENT_NAME
 api_version = AZURE_OPENAI_API_VERSION 
 subscription_key = AZURE_OPENAI_API_KEY
 
-client = AzureOpenAI(    
+client = AzureOpenAI(
     api_key=subscription_key,
     api_version=api_version,
     azure_endpoint=endpoint
 )
 
+# Async client for batch generation: many routes can have their requests
+# in flight at once instead of paying one round trip after another
+async_client = AsyncAzureOpenAI(
+    api_key=subscription_key,
+    api_version=api_version,
+    azure_endpoint=endpoint
+)
+
+# On-disk cache of completed generations keyed by a hash of the full
+# messages payload. Identical prompts (same route, personality, and
+# story influence) skip the model round trip entirely.
+PROMPT_CACHE_DIR = Path("data/.prompt_cache")
+PROMPT_CACHE_TTL = 24 * 60 * 60  # seconds
+
+logger = logging.getLogger(__name__)
+
+# Poem persistence happens off the generation path: the caller gets the
+# poem back as soon as the model responds while the disk write completes
+# in the background. Shutdown drains any pending writes.
+_save_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="poem-save")
+atexit.register(_save_executor.shutdown)
+
+
+def _log_save_failure(future):
+    """Surface background save errors that would otherwise vanish.
+
+    The submitted future is never awaited, so without this callback a
+    failed disk write would be silent data loss.
+    """
+    exc = future.exception()
+    if exc is not None:
+        logger.error("Background poem save failed: %s", exc, exc_info=exc)
+
+
+@functools.lru_cache(maxsize=256)
+def _build_system_prompt(route_id, tone, alignment):
+    """System prompt for a route; personality traits rarely change, so
+    the formatted string is cached per (route, tone, alignment)."""
+    return (
+        f"You are a poetic transit muse for Route {route_id}. "
+        f"Your poetic voice is {tone}, shaped by a sense of {alignment}. "
+        "You write vivid, rhythm-driven, speculative free verse poems inspired by urban transit and local myth. "
+        "Never explain your work—just create the poem. Avoid rhyme unless it happens naturally."
+    )
+
+
+def _prompt_cache_key(messages):
+    payload = json.dumps(messages, sort_keys=True).encode('utf-8')
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _prompt_cache_get(key):
+    path = PROMPT_CACHE_DIR / f"{key}.json"
+    try:
+        entry = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if time.time() - entry.get("created", 0) > PROMPT_CACHE_TTL:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+        return None
+    return entry.get("poem")
+
+
+def _prompt_cache_put(key, poem):
+    PROMPT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path = PROMPT_CACHE_DIR / f"{key}.json"
+    path.write_text(json.dumps({"created": time.time(), "poem": poem}))
+
+
+def memory_entry_iso_ts(entry):
+    """Format a memory entry's epoch timestamp as ISO 8601.
+
+    Memory entries store raw time.time() floats — appending skips the
+    datetime construction and string formatting — so serializers call
+    this when a readable timestamp is actually needed.
+    """
+    return datetime.fromtimestamp(entry["ts"], tz=timezone.utc).isoformat()
+
 class RouteAgent:
     def __init__(self, route_id):
         self.route_id = route_id
         self.personality = get_route_personality(route_id)
-        self.memory = []  # Stores past poem summaries or metadata
+        # Ring buffer of recent poem/message metadata: bounded so a
+        # long-running agent doesn't grow without limit (poems themselves
+        # persist via PoemStore)
+        self.memory = collections.deque(maxlen=256)
         self.goal = self._set_initial_goal()
         self.store = PoemStore()
+        self._personality_fp = None  # lazy fingerprint for cache keys
 
     def _set_initial_goal(self):
         # Placeholder goal logic—can evolve later
@@ -33,40 +128,156 @@ class RouteAgent:
 
     def receive_message(self, message):
         # Placeholder for future agent communication
-        self.memory.append({"type": "message", "content": message, "timestamp": datetime.utcnow().isoformat()})
+        self.memory.append({"type": "message", "content": message, "ts": time.time()})
 
-    def generate_poem(self, story_influence):
+    def _influence_cache_key(self, story_influence):
+        """Cache key derivable without building the prompt.
+
+        A hit here skips narrative computation and prompt assembly
+        entirely, not just the model call.
+        """
+        if self._personality_fp is None:
+            payload = json.dumps(self.personality, sort_keys=True).encode('utf-8')
+            self._personality_fp = hashlib.blake2b(payload, digest_size=8).hexdigest()
+        return f"{self.route_id}-{self._personality_fp}-{round(story_influence, 2)}"
+
+    def _build_messages(self, story_influence):
         narrative_data = apply_story_influence(self.route_id, self.personality, story_influence)
         prompt = build_poetry_prompt(self.route_id, self.personality, narrative_data, story_influence)
 
         # Customize the system prompt based on agent traits
-        alignment = self.personality["alignment"]
-        tone = self.personality["tone"]
-
-        system_prompt = (
-            f"You are a poetic transit muse for Route {self.route_id}. "
-            f"Your poetic voice is {tone}, shaped by a sense of {alignment}. "
-            "You write vivid, rhythm-driven, speculative free verse poems inspired by urban transit and local myth. "
-            "Never explain your work—just create the poem. Avoid rhyme unless it happens naturally."
+        system_prompt = _build_system_prompt(
+            self.route_id, self.personality["tone"], self.personality["alignment"]
         )
 
-        messages = [
+        return prompt, [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": prompt}
         ]
 
-        print("prompt:", prompt)
+    def _record_poem(self, poem_text, story_influence):
+        future = _save_executor.submit(
+            self.store.save_poem, self.route_id, poem_text, story_influence, self.personality
+        )
+        future.add_done_callback(_log_save_failure)
+        self.memory.append({"type": "poem", "content": poem_text, "ts": time.time()})
+
+    def generate_poem(self, story_influence, bypass_cache=False):
+        # Probe with the cheap key first; a hit means no narrative
+        # computation, no prompt assembly, no model call
+        influence_key = self._influence_cache_key(story_influence)
+        if not bypass_cache:
+            poem_text = _prompt_cache_get(influence_key)
+            if poem_text is not None:
+                self._record_poem(poem_text, story_influence)
+                return poem_text
+
+        prompt, messages = self._build_messages(story_influence)
+
+        logger.debug("prompt: %s", prompt)
+        cache_key = _prompt_cache_key(messages)
+        poem_text = None if bypass_cache else _prompt_cache_get(cache_key)
+
+        if poem_text is None:
+            try:
+                response = client.chat.completions.create(
+                    messages=messages,
+                    model=deployment,
+                )
+                poem_text = response.choices[0].message.content
+                _prompt_cache_put(cache_key, poem_text)
+                _prompt_cache_put(influence_key, poem_text)
+            except Exception as e:
+                poem_text = f"Error generating poem: {e}"
+
+        self._record_poem(poem_text, story_influence)
+
+        return poem_text
+
+    async def generate_poem_stream(self, story_influence, bypass_cache=False):
+        """Stream a poem as it generates.
+
+        Yields text chunks as the model produces them, so an upstream
+        handler can pipe them straight to the client (e.g. over SSE) —
+        the first words arrive well before the full poem exists. The
+        accumulated text is cached and persisted once the stream ends.
+        """
+        influence_key = self._influence_cache_key(story_influence)
+        if not bypass_cache:
+            poem_text = _prompt_cache_get(influence_key)
+            if poem_text is not None:
+                self._record_poem(poem_text, story_influence)
+                yield poem_text
+                return
+
+        prompt, messages = self._build_messages(story_influence)
+
+        logger.debug("prompt: %s", prompt)
+        cache_key = _prompt_cache_key(messages)
+        poem_text = None if bypass_cache else _prompt_cache_get(cache_key)
+
+        if poem_text is not None:
+            self._record_poem(poem_text, story_influence)
+            yield poem_text
+            return
+
+        buffer = io.StringIO()
         try:
-            response = client.chat.completions.create(                
+            response = await async_client.chat.completions.create(
                 messages=messages,
                 model=deployment,
+                stream=True,
             )
-            poem_text = response.choices[0].message.content
+            async for chunk in response:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    buffer.write(delta)
+                    yield delta
         except Exception as e:
-            poem_text = f"Error generating poem: {e}"
+            error_text = f"Error generating poem: {e}"
+            self._record_poem(error_text, story_influence)
+            yield error_text
+            return
+
+        poem_text = buffer.getvalue()
+        _prompt_cache_put(cache_key, poem_text)
+        _prompt_cache_put(influence_key, poem_text)
+        self._record_poem(poem_text, story_influence)
+
+    async def generate_poem_async(self, story_influence, bypass_cache=False):
+        """Async variant for batch generation.
+
+        Launch with asyncio.gather so a batch of routes pays roughly one
+        round trip of latency instead of one per route.
+        """
+        influence_key = self._influence_cache_key(story_influence)
+        if not bypass_cache:
+            poem_text = _prompt_cache_get(influence_key)
+            if poem_text is not None:
+                self._record_poem(poem_text, story_influence)
+                return poem_text
+
+        prompt, messages = self._build_messages(story_influence)
+
+        logger.debug("prompt: %s", prompt)
+        cache_key = _prompt_cache_key(messages)
+        poem_text = None if bypass_cache else _prompt_cache_get(cache_key)
+
+        if poem_text is None:
+            try:
+                response = await async_client.chat.completions.create(
+                    messages=messages,
+                    model=deployment,
+                )
+                poem_text = response.choices[0].message.content
+                _prompt_cache_put(cache_key, poem_text)
+                _prompt_cache_put(influence_key, poem_text)
+            except Exception as e:
+                poem_text = f"Error generating poem: {e}"
 
-        self.store.save_poem(self.route_id, poem_text, story_influence, self.personality)
-        self.memory.append({"type": "poem", "content": poem_text, "timestamp": datetime.utcnow().isoformat()})
+        self._record_poem(poem_text, story_influence)
 
         return poem_text
 
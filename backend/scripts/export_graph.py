@@ -20,6 +20,11 @@ sys.path.insert(0, str(backend_dir))
 
 from poetry.graph.extended_poetry_graph import ExtendedPoetryGraph
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class GraphExporter:
     """Exports graph data in various formats."""
@@ -30,24 +35,64 @@ class GraphExporter:
         self.exports_dir = backend_dir / "exports"
         self.exports_dir.mkdir(exist_ok=True)
         self.graph = None
-    
+        # Per-invocation memo of expanded poems: get_poem walks a poem's
+        # neighbors, and back-to-back exports would otherwise repeat that
+        # walk for every poem in each format
+        self._poem_cache: Dict[str, Dict[str, Any]] = {}
+        self._poems: List[tuple] = None
+        self._cooc_cache: Dict[tuple, Dict] = {}
+
     def load_graph(self) -> ExtendedPoetryGraph:
         """Load the graph."""
         if self.graph is None:
             if not self.graph_path.exists():
                 raise FileNotFoundError(f"Graph file not found: {self.graph_path}")
             self.graph = ExtendedPoetryGraph(str(self.graph_path))
+            self._poems = None
         return self.graph
-    
-    def export_poems_csv(self) -> str:
+
+    def _get_poem(self, poem_id: str) -> Dict[str, Any]:
+        """Expand a poem's connected elements once per export pass."""
+        full_data = self._poem_cache.get(poem_id)
+        if full_data is None:
+            full_data = self._poem_cache[poem_id] = self.graph.get_poem(poem_id)
+        return full_data
+
+    def _cooc(self, type_a: str, type_b: str) -> Dict:
+        """Co-occurrence counts for a type pair, computed once per graph.
+
+        The underlying query traverses every poem's edges; the graph is
+        loaded once per invocation and never mutated here, so the memo is
+        safe for the life of the instance.
+        """
+        key = (type_a, type_b)
+        result = self._cooc_cache.get(key)
+        if result is None:
+            result = self._cooc_cache[key] = self.load_graph().get_entity_co_occurrence(type_a, type_b)
+        return result
+
+    def _collect_poems(self) -> List[tuple]:
+        """One scan over the node set for the poem list.
+
+        Memoized on the instance: every export format wants the same
+        filtered list, including formats run individually on a reused
+        exporter. Invalidated when a new graph is loaded.
+        """
+        if self._poems is None:
+            self._poems = [(node_id, data) for node_id, data in self.graph.graph.nodes(data=True)
+                           if data.get("type") == "poem"]
+        return self._poems
+
+    def export_poems_csv(self, poems: List[tuple] = None, timestamp: str = None) -> str:
         """Export poems to CSV format."""
         graph = self.load_graph()
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if timestamp is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         csv_file = self.exports_dir / f"poems_{timestamp}.csv"
-        
-        poems = [(node_id, data) for node_id, data in graph.graph.nodes(data=True) 
-                if data.get("type") == "poem"]
-        
+
+        if poems is None:
+            poems = self._collect_poems()
+
         with open(csv_file, 'w', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
             
@@ -57,39 +102,43 @@ class GraphExporter:
                 'line_count', 'form', 'themes', 'imagery', 'emotions', 'sound_devices'
             ])
             
-            for poem_id, poem_data in poems:
-                full_data = graph.get_poem(poem_id)
-                
-                # Basic info
-                title = poem_data.get('title', '')
-                route_id = poem_data.get('route_id', '')
-                created_at = poem_data.get('created_at', '')
-                text = poem_data.get('text', '')
-                text_length = len(text)
-                
-                # Structure info
-                metadata = poem_data.get('metadata', {})
-                structure = metadata.get('structure', {})
-                line_count = structure.get('line_count', '')
-                form = structure.get('form', '')
-                
-                # Connected elements
-                themes = '; '.join(full_data.get('themes', []))
-                imagery = '; '.join(full_data.get('imagery', []))
-                emotions = '; '.join(full_data.get('emotions', []))
-                sound_devices = '; '.join(full_data.get('sound_devices', []))
-                
-                writer.writerow([
-                    poem_id, title, route_id, created_at, text_length,
-                    line_count, form, themes, imagery, emotions, sound_devices
-                ])
-        
+            # Yield rows into writerows so the per-row dispatch happens in
+            # the csv module rather than a Python-level writerow call each
+            join = '; '.join
+
+            def _rows():
+                for poem_id, poem_data in poems:
+                    full_data = self._get_poem(poem_id)
+                    structure = poem_data.get('metadata', {}).get('structure', {})
+                    themes, imagery, emotions, sounds = (
+                        full_data.get('themes', ()),
+                        full_data.get('imagery', ()),
+                        full_data.get('emotions', ()),
+                        full_data.get('sound_devices', ()),
+                    )
+                    yield (
+                        poem_id,
+                        poem_data.get('title', ''),
+                        poem_data.get('route_id', ''),
+                        poem_data.get('created_at', ''),
+                        len(poem_data.get('text', '')),
+                        structure.get('line_count', ''),
+                        structure.get('form', ''),
+                        join(themes),
+                        join(imagery),
+                        join(emotions),
+                        join(sounds),
+                    )
+
+            writer.writerows(_rows())
+
         return str(csv_file)
     
-    def export_connections_csv(self) -> str:
+    def export_connections_csv(self, timestamp: str = None) -> str:
         """Export connections/relationships to CSV."""
         graph = self.load_graph()
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if timestamp is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         csv_file = self.exports_dir / f"connections_{timestamp}.csv"
         
         with open(csv_file, 'w', newline='', encoding='utf-8') as f:
@@ -101,51 +150,55 @@ class GraphExporter:
                 'connection_type', 'source_name', 'target_name'
             ])
             
-            for source, target, edge_data in graph.graph.edges(data=True):
-                source_data = graph.graph.nodes[source]
-                target_data = graph.graph.nodes[target]
-                
-                source_type = source_data.get('type', 'unknown')
-                target_type = target_data.get('type', 'unknown')
-                connection_type = edge_data.get('type', 'unknown')
-                
-                source_name = source_data.get('name', source_data.get('title', source))
-                target_name = target_data.get('name', target_data.get('title', target))
-                
-                writer.writerow([
-                    source, target, source_type, target_type,
-                    connection_type, source_name, target_name
-                ])
-        
+            nodes = graph.graph.nodes
+
+            def _rows():
+                for source, target, edge_data in graph.graph.edges(data=True):
+                    source_data = nodes[source]
+                    target_data = nodes[target]
+                    yield (
+                        source, target,
+                        source_data.get('type', 'unknown'),
+                        target_data.get('type', 'unknown'),
+                        edge_data.get('type', 'unknown'),
+                        source_data.get('name', source_data.get('title', source)),
+                        target_data.get('name', target_data.get('title', target)),
+                    )
+
+            writer.writerows(_rows())
+
         return str(csv_file)
     
-    def export_summary_json(self) -> str:
+    def export_summary_json(self, timestamp: str = None) -> str:
         """Export a summary of the graph in JSON format."""
         graph = self.load_graph()
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if timestamp is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         json_file = self.exports_dir / f"graph_summary_{timestamp}.json"
         
         # Collect summary data
         summary = graph.get_graph_summary()
         route_stats = graph.get_all_routes_statistics()
         
-        # Get element counts
+        # Get element counts; the adjacency dict length is the neighbor
+        # count without a list allocation per node, and setdefault folds
+        # the key check and insert into one call
+        succ = graph.graph.succ
         elements_by_type = {}
         for node_id, node_data in graph.graph.nodes(data=True):
             node_type = node_data.get('type', 'unknown')
-            if node_type not in elements_by_type:
-                elements_by_type[node_type] = []
-            
+            bucket = elements_by_type.setdefault(node_type, [])
+
             if node_type != 'poem':
-                elements_by_type[node_type].append({
+                bucket.append({
                     'id': node_id,
                     'name': node_data.get('name', node_id),
-                    'connections': len(list(graph.graph.neighbors(node_id)))
+                    'connections': len(succ[node_id])
                 })
         
         # Get co-occurrence data
-        theme_emotion = graph.get_entity_co_occurrence("theme", "emotion")
-        imagery_emotion = graph.get_entity_co_occurrence("imagery", "emotion")
+        theme_emotion = self._cooc("theme", "emotion")
+        imagery_emotion = self._cooc("imagery", "emotion")
         
         # Convert tuple keys to strings for JSON serialization
         theme_emotion_str = {f"{k[0]}+{k[1]}": v for k, v in theme_emotion.items()}
@@ -162,70 +215,86 @@ class GraphExporter:
             }
         }
         
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
-        
+        # orjson serializes in one shot to bytes, far faster and leaner
+        # than the stdlib encoder on a large graph summary
+        if orjson is not None:
+            json_file.write_bytes(orjson.dumps(export_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(json_file, 'w', encoding='utf-8') as f:
+                json.dump(export_data, f, indent=2, ensure_ascii=False)
+
         return str(json_file)
     
-    def export_poems_text(self) -> str:
+    def export_poems_text(self, poems: List[tuple] = None, timestamp: str = None) -> str:
         """Export all poems as a single text file."""
         graph = self.load_graph()
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if timestamp is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         text_file = self.exports_dir / f"all_poems_{timestamp}.txt"
-        
-        poems = [(node_id, data) for node_id, data in graph.graph.nodes(data=True) 
-                if data.get("type") == "poem"]
-        
-        # Sort by creation date
-        poems_with_dates = []
-        for poem_id, poem_data in poems:
-            created_at = poem_data.get("created_at", "")
-            try:
-                dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                poems_with_dates.append((dt, poem_id, poem_data))
-            except:
-                poems_with_dates.append((datetime.min, poem_id, poem_data))
-        
-        poems_with_dates.sort(key=lambda x: x[0])
-        
+
+        if poems is None:
+            poems = self._collect_poems()
+
+        # ISO-8601 strings sort chronologically as-is, so order on the raw
+        # created_at value and skip per-poem datetime parsing entirely;
+        # undated poems sort first as before
+        poems_sorted = sorted(poems, key=lambda p: p[1].get("created_at") or "")
+
+        rule = "=" * 60
         with open(text_file, 'w', encoding='utf-8') as f:
-            f.write("MARTA POETRY PROJECT - COMPLETE COLLECTION\n")
-            f.write("=" * 60 + "\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Total Poems: {len(poems)}\n")
-            f.write("=" * 60 + "\n\n")
-            
-            for i, (dt, poem_id, poem_data) in enumerate(poems_with_dates, 1):
+            f.write(
+                "MARTA POETRY PROJECT - COMPLETE COLLECTION\n"
+                f"{rule}\n"
+                f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+                f"Total Poems: {len(poems)}\n"
+                f"{rule}\n\n"
+            )
+
+            # One write per poem: assemble the block as a single f-string
+            # instead of six small write calls
+            for i, (poem_id, poem_data) in enumerate(poems_sorted, 1):
                 title = poem_data.get('title', 'Untitled')
                 route_id = poem_data.get('route_id', 'Unknown')
                 text = poem_data.get('text', '')
-                
-                f.write(f"{i}. {title}\n")
-                f.write(f"Route: {route_id}\n")
-                if dt != datetime.min:
-                    f.write(f"Created: {dt.strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write("-" * 40 + "\n")
-                f.write(text + "\n")
-                f.write("=" * 60 + "\n\n")
-        
+                created_at = poem_data.get('created_at', '')
+
+                # Slice the ISO string into "YYYY-MM-DD HH:MM:SS"
+                created_line = (
+                    f"Created: {created_at[:10]} {created_at[11:19]}\n" if created_at else ""
+                )
+                f.write(
+                    f"{i}. {title}\n"
+                    f"Route: {route_id}\n"
+                    f"{created_line}"
+                    f"{'-' * 40}\n"
+                    f"{text}\n"
+                    f"{rule}\n\n"
+                )
+
         return str(text_file)
     
     def export_all(self) -> Dict[str, str]:
         """Export in all formats."""
         exports = {}
-        
+        self.load_graph()
+        poems = self._collect_poems()
+        # One timestamp for the whole session so the four files share a
+        # suffix instead of straddling a second boundary
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
         print("📤 Exporting poems CSV...")
-        exports['poems_csv'] = self.export_poems_csv()
-        
+        exports['poems_csv'] = self.export_poems_csv(poems, timestamp)
+
         print("📤 Exporting connections CSV...")
-        exports['connections_csv'] = self.export_connections_csv()
-        
+        exports['connections_csv'] = self.export_connections_csv(timestamp)
+
         print("📤 Exporting summary JSON...")
-        exports['summary_json'] = self.export_summary_json()
-        
+        exports['summary_json'] = self.export_summary_json(timestamp)
+
         print("📤 Exporting poems text...")
-        exports['poems_text'] = self.export_poems_text()
-        
+        exports['poems_text'] = self.export_poems_text(poems, timestamp)
+
+        self._poem_cache.clear()
         return exports
 
 
@@ -7,6 +7,7 @@ This script creates detailed reports about your poetry graph that you can save a
 
 import sys
 import os
+import heapq
 import json
 import argparse
 from pathlib import Path
@@ -21,6 +22,25 @@ sys.path.insert(0, str(backend_dir))
 from poetry.graph.extended_poetry_graph import ExtendedPoetryGraph
 
 
+def _safe_parse(date_str, _fromiso=datetime.fromisoformat, _min=datetime.min) -> datetime:
+    """Parse an ISO timestamp, returning datetime.min when it won't parse.
+
+    fromisoformat accepts a trailing Z natively on Python 3.11+, so no
+    per-call string rewrite is needed; the parser and sentinel are bound
+    as defaults to skip the global lookups in hot loops.
+    """
+    if not date_str:
+        return _min
+    try:
+        return _fromiso(date_str)
+    except (ValueError, TypeError):
+        return _min
+
+
+# Qualitative sound-pattern levels recognized by the literary analysis
+_LEVELS = frozenset(('high', 'moderate', 'low'))
+
+
 class GraphReportGenerator:
     """Generates comprehensive reports about the poetry graph."""
     
@@ -30,19 +50,61 @@ class GraphReportGenerator:
         self.graph = None
         self.reports_dir = backend_dir / "reports"
         self.reports_dir.mkdir(exist_ok=True)
-    
+        # Per-report memo of expanded poems so get_poem's neighbor walk
+        # runs at most once per poem per report
+        self._poem_cache: Dict[str, Dict[str, Any]] = {}
+        self._nodes_cache = None
+        self._cooc_cache: Dict[tuple, Dict] = {}
+
     def load_graph(self) -> ExtendedPoetryGraph:
         """Load the graph."""
         if self.graph is None:
             if not self.graph_path.exists():
                 raise FileNotFoundError(f"Graph file not found: {self.graph_path}")
             self.graph = ExtendedPoetryGraph(str(self.graph_path))
+            self._nodes_cache = None
         return self.graph
-    
+
+    def _get_poem(self, poem_id: str) -> Dict[str, Any]:
+        """Expand a poem's connected elements once per report."""
+        full_data = self._poem_cache.get(poem_id)
+        if full_data is None:
+            full_data = self._poem_cache[poem_id] = self.graph.get_poem(poem_id)
+        return full_data
+
+    def _cooc(self, type_a: str, type_b: str) -> Dict:
+        """Co-occurrence counts for a type pair, computed once per graph.
+
+        The underlying query traverses every poem's edges; the graph is
+        loaded once per invocation and never mutated here, so the memo is
+        safe for the life of the instance.
+        """
+        key = (type_a, type_b)
+        result = self._cooc_cache.get(key)
+        if result is None:
+            result = self._cooc_cache[key] = self.load_graph().get_entity_co_occurrence(type_a, type_b)
+        return result
+
+    def _collect_nodes(self) -> tuple:
+        """Classify all nodes by type in one scan.
+
+        Every section of the report wants the poem list (and sometimes
+        other types); one pass over nodes(data=True) replaces a scan per
+        section. Memoized on the instance and invalidated when a new
+        graph is loaded, so repeated reports reuse the classification.
+        """
+        if self._nodes_cache is None:
+            nodes_by_type: Dict[str, List] = {}
+            for node_id, data in self.graph.graph.nodes(data=True):
+                nodes_by_type.setdefault(data.get("type", "unknown"), []).append((node_id, data))
+            self._nodes_cache = (nodes_by_type.get("poem", []), nodes_by_type)
+        return self._nodes_cache
+
     def generate_full_report(self, save_to_file: bool = True) -> str:
         """Generate a comprehensive report of the entire graph."""
         graph = self.load_graph()
-        
+        poems, nodes_by_type = self._collect_nodes()
+
         report_lines = []
         report_lines.append("=" * 80)
         report_lines.append("📊 MARTA POETRY PROJECT - COMPLETE GRAPH REPORT")
@@ -50,28 +112,29 @@ class GraphReportGenerator:
         report_lines.append("=" * 80)
         
         # 1. Executive Summary
-        report_lines.extend(self._generate_executive_summary(graph))
-        
+        report_lines.extend(self._generate_executive_summary(graph, poems))
+
         # 2. Route Analysis
         report_lines.extend(self._generate_route_analysis(graph))
-        
+
         # 3. Thematic Analysis
         report_lines.extend(self._generate_thematic_analysis(graph))
-        
+
         # 4. Literary Analysis
-        report_lines.extend(self._generate_literary_analysis(graph))
-        
+        report_lines.extend(self._generate_literary_analysis(graph, poems))
+
         # 5. Temporal Analysis
-        report_lines.extend(self._generate_temporal_analysis(graph))
-        
+        report_lines.extend(self._generate_temporal_analysis(graph, poems))
+
         # 6. Network Analysis
-        report_lines.extend(self._generate_network_analysis(graph))
-        
+        report_lines.extend(self._generate_network_analysis(graph, poems))
+
         # 7. Individual Poem Details
-        report_lines.extend(self._generate_poem_catalog(graph))
+        report_lines.extend(self._generate_poem_catalog(graph, poems))
         
         report_content = "\n".join(report_lines)
-        
+        self._poem_cache.clear()
+
         if save_to_file:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             report_file = self.reports_dir / f"graph_report_{timestamp}.txt"
@@ -81,16 +144,14 @@ class GraphReportGenerator:
         
         return report_content
     
-    def _generate_executive_summary(self, graph: ExtendedPoetryGraph) -> List[str]:
+    def _generate_executive_summary(self, graph: ExtendedPoetryGraph, poems: List[tuple]) -> List[str]:
         """Generate executive summary section."""
         lines = []
         lines.append("\n" + "🎯 EXECUTIVE SUMMARY")
         lines.append("-" * 40)
-        
+
         summary = graph.get_graph_summary()
-        poems = [(node_id, data) for node_id, data in graph.graph.nodes(data=True) 
-                if data.get("type") == "poem"]
-        
+
         lines.append(f"Total Poems: {summary['total_poems']}")
         lines.append(f"Contributing Routes: {summary['contributing_routes']}")
         lines.append(f"Unique Themes: {summary['total_themes']}")
@@ -152,67 +213,53 @@ class GraphReportGenerator:
         lines.append("-" * 40)
         
         # Get theme co-occurrences
-        theme_emotion = graph.get_entity_co_occurrence("theme", "emotion")
+        theme_emotion = self._cooc("theme", "emotion")
         
         lines.append("Most Common Theme-Emotion Combinations:")
         if theme_emotion:
-            sorted_pairs = sorted(theme_emotion.items(), key=lambda x: x[1], reverse=True)
-            for i, ((theme, emotion), count) in enumerate(sorted_pairs[:10], 1):
+            top_pairs = heapq.nlargest(10, theme_emotion.items(), key=lambda x: x[1])
+            for i, ((theme, emotion), count) in enumerate(top_pairs, 1):
                 lines.append(f"  {i:2}. {theme} + {emotion}: {count} occurrences")
         
         # Get imagery-emotion pairs
-        imagery_emotion = graph.get_entity_co_occurrence("imagery", "emotion")
+        imagery_emotion = self._cooc("imagery", "emotion")
         
         lines.append("\nMost Common Imagery-Emotion Combinations:")
         if imagery_emotion:
-            sorted_pairs = sorted(imagery_emotion.items(), key=lambda x: x[1], reverse=True)
-            for i, ((imagery, emotion), count) in enumerate(sorted_pairs[:10], 1):
+            top_pairs = heapq.nlargest(10, imagery_emotion.items(), key=lambda x: x[1])
+            for i, ((imagery, emotion), count) in enumerate(top_pairs, 1):
                 lines.append(f"  {i:2}. {imagery} + {emotion}: {count} occurrences")
         
         return lines
     
-    def _generate_literary_analysis(self, graph: ExtendedPoetryGraph) -> List[str]:
+    def _generate_literary_analysis(self, graph: ExtendedPoetryGraph, poems: List[tuple]) -> List[str]:
         """Generate literary analysis section."""
         lines = []
         lines.append("\n" + "🎨 LITERARY ANALYSIS")
         lines.append("-" * 40)
-        
-        poems = [(node_id, data) for node_id, data in graph.graph.nodes(data=True) 
-                if data.get("type") == "poem"]
-        
-        # Analyze structures
-        line_counts = []
-        forms = []
-        enjambments = []
-        caesuras = []
+
+        # Analyze structures: pull each poem's structure dict once, then
+        # build the metric lists as comprehensions
+        structures = [data.get("metadata", {}).get("structure", {}) for _, data in poems]
+        line_counts = [s["line_count"] for s in structures if s.get("line_count", 0) > 0]
+        forms = [s["form"] for s in structures if s.get("form", "unknown") != "unknown"]
+        enjambments = [len(s["enjambment_lines"]) for s in structures if s.get("enjambment_lines")]
+        caesuras = [len(s["caesura_lines"]) for s in structures if s.get("caesura_lines")]
+
+        # Count sound patterns in one tight pass: exact type checks
+        # against a frozenset avoid isinstance and list-literal rebuilds
+        # per value
         sound_patterns = defaultdict(int)
-        
+        sp = sound_patterns
         for poem_id, poem_data in poems:
-            metadata = poem_data.get("metadata", {})
-            structure = metadata.get("structure", {})
-            sound_data = metadata.get("sound_patterns", {})
-            
-            if structure:
-                line_count = structure.get("line_count", 0)
-                form = structure.get("form", "unknown")
-                enjambment_lines = structure.get("enjambment_lines", [])
-                caesura_lines = structure.get("caesura_lines", [])
-                
-                if line_count > 0:
-                    line_counts.append(line_count)
-                if form != "unknown":
-                    forms.append(form)
-                if enjambment_lines:
-                    enjambments.append(len(enjambment_lines))
-                if caesura_lines:
-                    caesuras.append(len(caesura_lines))
-            
-            # Count sound patterns
+            sound_data = poem_data.get("metadata", {}).get("sound_patterns", {})
             for pattern, value in sound_data.items():
-                if isinstance(value, str) and value in ['high', 'moderate', 'low']:
-                    sound_patterns[f"{pattern}_{value}"] += 1
-                elif isinstance(value, (int, float)):
-                    sound_patterns[pattern] += value
+                t = type(value)
+                if t is str:
+                    if value in _LEVELS:
+                        sp[f"{pattern}_{value}"] += 1
+                elif t is int or t is float:
+                    sp[pattern] += value
         
         lines.append("Structural Patterns:")
         if line_counts:
@@ -237,32 +284,24 @@ class GraphReportGenerator:
         
         if sound_patterns:
             lines.append("\nSound Pattern Distribution:")
-            for pattern, count in sorted(sound_patterns.items())[:10]:
+            for pattern, count in heapq.nsmallest(10, sound_patterns.items()):
                 lines.append(f"  • {pattern}: {count}")
         
         return lines
     
-    def _generate_temporal_analysis(self, graph: ExtendedPoetryGraph) -> List[str]:
+    def _generate_temporal_analysis(self, graph: ExtendedPoetryGraph, poems: List[tuple]) -> List[str]:
         """Generate temporal analysis section."""
         lines = []
         lines.append("\n" + "⏰ TEMPORAL ANALYSIS")
         lines.append("-" * 40)
-        
-        poems = [(node_id, data) for node_id, data in graph.graph.nodes(data=True) 
-                if data.get("type") == "poem"]
-        
-        # Parse dates
-        poem_dates = []
-        for poem_id, poem_data in poems:
-            created_at = poem_data.get("created_at")
-            if created_at:
-                try:
-                    # Parse ISO format
-                    dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                    poem_dates.append((dt, poem_id, poem_data))
-                except:
-                    continue
-        
+
+        # Parse dates, dropping poems without a usable timestamp
+        poem_dates = [
+            (dt, poem_id, poem_data)
+            for poem_id, poem_data in poems
+            if (dt := _safe_parse(poem_data.get("created_at"))) != datetime.min
+        ]
+
         if not poem_dates:
             lines.append("No temporal data available.")
             return lines
@@ -274,13 +313,9 @@ class GraphReportGenerator:
         lines.append(f"First poem: {poem_dates[0][0].strftime('%Y-%m-%d %H:%M')}")
         lines.append(f"Latest poem: {poem_dates[-1][0].strftime('%Y-%m-%d %H:%M')}")
         
-        # Group by day
-        daily_counts = defaultdict(int)
-        hourly_counts = defaultdict(int)
-        
-        for dt, poem_id, poem_data in poem_dates:
-            daily_counts[dt.date()] += 1
-            hourly_counts[dt.hour] += 1
+        # Group by day and hour; Counter aggregates the generators in C
+        daily_counts = Counter(dt.date() for dt, _, _ in poem_dates)
+        hourly_counts = Counter(dt.hour for dt, _, _ in poem_dates)
         
         if len(daily_counts) > 1:
             lines.append(f"\nDaily distribution:")
@@ -289,38 +324,35 @@ class GraphReportGenerator:
         
         if hourly_counts:
             lines.append(f"\nHourly distribution:")
-            peak_hours = sorted(hourly_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+            peak_hours = heapq.nlargest(5, hourly_counts.items(), key=lambda x: x[1])
             for hour, count in peak_hours:
                 lines.append(f"  • {hour:02d}:00: {count} poems")
         
         return lines
     
-    def _generate_network_analysis(self, graph: ExtendedPoetryGraph) -> List[str]:
+    def _generate_network_analysis(self, graph: ExtendedPoetryGraph, poems: List[tuple]) -> List[str]:
         """Generate network analysis section."""
         lines = []
         lines.append("\n" + "🕸️  NETWORK ANALYSIS")
         lines.append("-" * 40)
         
-        # Count connections by type
-        connection_types = defaultdict(int)
-        for u, v, data in graph.graph.edges(data=True):
-            edge_type = data.get('type', 'unknown')
-            connection_types[edge_type] += 1
-        
+        # Count connections by type; Counter aggregates the generator in C
+        connection_types = Counter(
+            data.get('type', 'unknown') for _, _, data in graph.graph.edges(data=True)
+        )
+
         lines.append("Connection Types:")
         for conn_type, count in sorted(connection_types.items()):
             lines.append(f"  • {conn_type}: {count}")
         
-        # Find most connected poems
-        poem_connections = defaultdict(int)
-        for node_id, node_data in graph.graph.nodes(data=True):
-            if node_data.get("type") == "poem":
-                connections = len(list(graph.graph.neighbors(node_id)))
-                poem_connections[node_id] = connections
+        # Find most connected poems; the adjacency dict length is the
+        # neighbor count without materializing a list per poem
+        succ = graph.graph.succ
+        poem_connections = {node_id: len(succ[node_id]) for node_id, node_data in poems}
         
         if poem_connections:
             lines.append("\nMost Connected Poems:")
-            top_connected = sorted(poem_connections.items(), key=lambda x: x[1], reverse=True)[:5]
+            top_connected = heapq.nlargest(5, poem_connections.items(), key=lambda x: x[1])
             for poem_id, conn_count in top_connected:
                 poem_data = graph.graph.nodes[poem_id]
                 title = poem_data.get("title", "Untitled")[:40]
@@ -328,60 +360,61 @@ class GraphReportGenerator:
         
         return lines
     
-    def _generate_poem_catalog(self, graph: ExtendedPoetryGraph) -> List[str]:
+    def _generate_poem_catalog(self, graph: ExtendedPoetryGraph, poems: List[tuple]) -> List[str]:
         """Generate detailed poem catalog."""
         lines = []
         lines.append("\n" + "📚 COMPLETE POEM CATALOG")
         lines.append("-" * 40)
-        
-        poems = [(node_id, data) for node_id, data in graph.graph.nodes(data=True) 
-                if data.get("type") == "poem"]
-        
-        # Sort by creation date
-        poems_with_dates = []
-        for poem_id, poem_data in poems:
+
+        # ISO-8601 strings sort chronologically as-is: order on the raw
+        # created_at value instead of parsing a datetime per poem;
+        # undated poems sort first as before
+        poems_sorted = sorted(poems, key=lambda p: p[1].get("created_at") or "")
+
+        # One append per poem: each entry is assembled as a single block
+        # instead of eight-plus list appends in the hottest report loop
+        for i, (poem_id, poem_data) in enumerate(poems_sorted, 1):
             created_at = poem_data.get("created_at", "")
-            try:
-                dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                poems_with_dates.append((dt, poem_id, poem_data))
-            except:
-                # Put undated poems at the end
-                poems_with_dates.append((datetime.min, poem_id, poem_data))
-        
-        poems_with_dates.sort(key=lambda x: x[0])
-        
-        for i, (dt, poem_id, poem_data) in enumerate(poems_with_dates, 1):
-            lines.append(f"\n{i:2}. {poem_data.get('title', 'Untitled')}")
-            lines.append(f"    ID: {poem_id}")
-            lines.append(f"    Route: {poem_data.get('route_id', 'Unknown')}")
-            
-            if dt != datetime.min:
-                lines.append(f"    Created: {dt.strftime('%Y-%m-%d %H:%M:%S')}")
-            
+            # Slice the ISO string into "YYYY-MM-DD HH:MM:SS"
+            created_line = (
+                f"\n    Created: {created_at[:10]} {created_at[11:19]}" if created_at else ""
+            )
+
             # Get connected elements
-            full_poem_data = graph.get_poem(poem_id)
+            full_poem_data = self._get_poem(poem_id)
             themes = full_poem_data.get('themes', [])
             imagery = full_poem_data.get('imagery', [])
             emotions = full_poem_data.get('emotions', [])
             sound_devices = full_poem_data.get('sound_devices', [])
-            
+
+            element_lines = ""
             if themes:
-                lines.append(f"    Themes: {', '.join(themes[:5])}{'...' if len(themes) > 5 else ''}")
+                element_lines += f"\n    Themes: {', '.join(themes[:5])}{'...' if len(themes) > 5 else ''}"
             if imagery:
-                lines.append(f"    Imagery: {', '.join(imagery[:5])}{'...' if len(imagery) > 5 else ''}")
+                element_lines += f"\n    Imagery: {', '.join(imagery[:5])}{'...' if len(imagery) > 5 else ''}"
             if emotions:
-                lines.append(f"    Emotions: {', '.join(emotions[:3])}")
+                element_lines += f"\n    Emotions: {', '.join(emotions[:3])}"
             if sound_devices:
-                lines.append(f"    Sound: {', '.join(sound_devices[:3])}")
-            
-            # Show first line of poem
+                element_lines += f"\n    Sound: {', '.join(sound_devices[:3])}"
+
+            # Show first line of poem; find the newline once instead of
+            # splitting the whole text into a list twice
             text = poem_data.get("text", "")
+            preview = ""
             if text:
-                first_line = text.split('\n')[0][:60]
-                if len(text.split('\n')[0]) > 60:
-                    first_line += "..."
-                lines.append(f"    \"{first_line}\"")
-        
+                nl = text.find('\n')
+                first_line = text if nl < 0 else text[:nl]
+                if len(first_line) > 60:
+                    first_line = first_line[:60] + "..."
+                preview = f"\n    \"{first_line}\""
+
+            lines.append(
+                f"\n{i:2}. {poem_data.get('title', 'Untitled')}\n"
+                f"    ID: {poem_id}\n"
+                f"    Route: {poem_data.get('route_id', 'Unknown')}"
+                f"{created_line}{element_lines}{preview}"
+            )
+
         return lines
 
 
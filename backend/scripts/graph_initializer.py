@@ -19,6 +19,13 @@ import sys
 import os
 import json
 import argparse
+import heapq
+import mmap
+import queue
+import threading
+from array import array
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, Any, List
 from datetime import datetime
@@ -31,27 +38,89 @@ from poetry.graph.extended_poetry_graph import ExtendedPoetryGraph
 from poetry.graph.poem_analyzer_azure import PoemAnalyzer
 from config import AZURE_OPENAI_API_KEY, AZURE_OPENAI_ENDPOINT, AZURE_OPENAI_DEPLOYMENT_NAME, AZURE_OPENAI_API_VERSION
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson parses UTF-8 bytes directly and is several times faster than
+# the stdlib decoder; fall back to json.loads when it isn't installed
+_loads = orjson.loads if orjson is not None else json.loads
+
+# File extensions the initializer accepts as poem sources
+_POEM_SUFFIXES = frozenset({".txt", ".md", ".json"})
+
+# Duplicate-poem prompt responses mapped to actions; anything else skips
+_DUP_ACTIONS = {'o': 'overwrite', 'overwrite': 'overwrite', 'r': 'rename', 'rename': 'rename'}
+
+# Files above this size are memory-mapped instead of read()
+_MMAP_THRESHOLD = 64 * 1024
+
+# Route ids with a special narrative role; everything else is route_generated
+_ROLE_CACHE = {"MANUAL": "core"}
+
+
+def _read_poem_payload(poem_file: Path, is_json: bool):
+    """Read a poem file into its parse payload (dict for JSON, text otherwise).
+
+    Large files (multi-megabyte anthologies) are memory-mapped so the
+    parser consumes the page cache directly instead of copying the
+    whole file through a read buffer first; orjson parses the mapped
+    buffer in place.
+    """
+    if os.stat(poem_file).st_size > _MMAP_THRESHOLD:
+        with open(poem_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if is_json:
+                # orjson parses the mapped pages through a memoryview;
+                # stdlib json can't take a buffer object, only bytes
+                return _loads(memoryview(mm)) if orjson is not None else _loads(bytes(mm))
+            return bytes(mm).decode('utf-8')
+
+    raw = poem_file.read_bytes()
+    return _loads(raw) if is_json else raw.decode('utf-8')
+
 
 class GraphManager:
     """Manages the poetry graph for manual operations."""
-    
-    def __init__(self):
+
+    __slots__ = ("graph_path", "_graph_path_str", "poems_dir", "graph", "analyzer",
+                 "_dirty_ids", "use_cache")
+
+    def __init__(self, use_cache: bool = True):
         """Initialize the graph manager."""
-        self.graph_path = backend_dir / "data" / "poetry_graph.json"
+        # Keep the string form alongside the Path so downstream calls
+        # don't re-stringify it on every use
+        self._graph_path_str = os.path.join(str(backend_dir), "data", "poetry_graph.json")
+        self.graph_path = Path(self._graph_path_str)
         self.poems_dir = backend_dir / "poems"
         self.graph = None
         self.analyzer = None
-        
+        # Poem ids touched this run, so saving can append just those as
+        # a delta instead of rewriting the whole graph file
+        self._dirty_ids = set()
+        self.use_cache = use_cache
+        
+    def _refresh_graph_cache(self):
+        """Write the pickle sidecar for the currently loaded graph."""
+        self.graph.refresh_cache()
+
     def load_or_create_graph(self) -> ExtendedPoetryGraph:
         """Load existing graph or create new one."""
         if self.graph is None:
             if self.graph_path.exists():
-                print(f"📂 Loading existing graph from {self.graph_path}")
-                self.graph = ExtendedPoetryGraph(str(self.graph_path))
+                if self.use_cache:
+                    self.graph = ExtendedPoetryGraph.load_cached(self._graph_path_str)
+                if self.graph is not None:
+                    print(f"⚡ Loaded graph from pickle cache")
+                else:
+                    print(f"📂 Loading existing graph from {self.graph_path}")
+                    self.graph = ExtendedPoetryGraph(self._graph_path_str)
+                    if self.use_cache:
+                        self._refresh_graph_cache()
             else:
                 print("🆕 Creating new graph")
                 self.graph = ExtendedPoetryGraph()
-                self.graph.graph_path = str(self.graph_path)
+                self.graph.graph_path = self._graph_path_str
         return self.graph
     
     def get_analyzer(self) -> PoemAnalyzer:
@@ -59,7 +128,55 @@ class GraphManager:
         if self.analyzer is None:
             self.analyzer = PoemAnalyzer()
         return self.analyzer
+
+    def _iter_poem_files(self):
+        """Yield poem files from the poems directory in one scandir pass.
+
+        One directory scan with DirEntry's cached stat replaces three
+        glob calls, each of which walks the directory and stats every
+        entry again.
+        """
+        with os.scandir(self.poems_dir) as it:
+            for entry in it:
+                if entry.is_file() and os.path.splitext(entry.name)[1].lower() in _POEM_SUFFIXES:
+                    yield Path(entry.path)
     
+    @staticmethod
+    def _prefetch_poem_files(poem_files, out_q: "queue.Queue"):
+        """Producer: read poem files ahead of the consumer loop.
+
+        Accepts any iterable of paths, including the scandir generator,
+        so discovery streams through the same thread as the reads.
+
+        Runs on a background thread so the next file's disk read (and,
+        for JSON, its parse) overlaps the main loop's processing of the
+        current one. Pushes (path, payload) where payload is the parsed
+        dict for JSON files, the decoded text otherwise, or the
+        exception the read raised; a None sentinel marks the end.
+        """
+        try:
+            for poem_file in poem_files:
+                try:
+                    is_json = os.path.splitext(poem_file.name)[1].lower() == ".json"
+                    payload = _read_poem_payload(poem_file, is_json)
+                except Exception as e:
+                    payload = e
+                out_q.put((poem_file, payload))
+        finally:
+            out_q.put(None)
+
+    def _index_nodes_by_type(self, graph: ExtendedPoetryGraph) -> Dict[str, List[tuple]]:
+        """Bucket (node_id, data) pairs by node type in one scan.
+
+        examine_graph filters the node set five times (poems plus four
+        element listings); building the index once turns those into dict
+        lookups.
+        """
+        index = defaultdict(list)
+        for node_id, data in graph.graph.nodes(data=True):
+            index[data.get("type", "unknown")].append((node_id, data))
+        return index
+
     def examine_graph(self):
         """Examine the current state of the graph."""
         graph = self.load_or_create_graph()
@@ -79,10 +196,10 @@ class GraphManager:
         print(f"   • Contributing routes: {summary['contributing_routes']}")
         print(f"   • Total connections: {summary['total_connections']}")
         
-        # Get all poems
-        poems = [(node_id, data) for node_id, data in graph.graph.nodes(data=True) 
-                if data.get("type") == "poem"]
-        
+        # Classify nodes once for the poem list and element listings below
+        index = self._index_nodes_by_type(graph)
+        poems = index.get("poem", [])
+
         if not poems:
             print("\n❌ No poems found in graph!")
             return
@@ -107,36 +224,41 @@ class GraphManager:
                 poem_count = stats['poem_count']
                 print(f"   • {route_id}: {poem_count} poems")
         
-        # Show most common themes/imagery/emotions
-        self._show_common_elements(graph, "theme", "🎭 Themes")
-        self._show_common_elements(graph, "imagery", "🖼️  Imagery")
-        self._show_common_elements(graph, "emotion", "💭 Emotions")
-        self._show_common_elements(graph, "sound_device", "🎵 Sound Devices")
-    
-    def _show_common_elements(self, graph: ExtendedPoetryGraph, element_type: str, title: str):
+        # Show most common themes/imagery/emotions. The poem-id set is
+        # shared across the four listings so each element's poem count is
+        # one set intersection instead of a per-neighbor type lookup
+        poem_ids = frozenset(poem_id for poem_id, _ in poems)
+        self._show_common_elements(graph, "theme", "🎭 Themes", index, poem_ids)
+        self._show_common_elements(graph, "imagery", "🖼️  Imagery", index, poem_ids)
+        self._show_common_elements(graph, "emotion", "💭 Emotions", index, poem_ids)
+        self._show_common_elements(graph, "sound_device", "🎵 Sound Devices", index, poem_ids)
+
+    def _show_common_elements(self, graph: ExtendedPoetryGraph, element_type: str, title: str,
+                              index: Dict[str, List[tuple]], poem_ids: frozenset):
         """Show most common elements of a given type."""
-        elements = [(node_id, data) for node_id, data in graph.graph.nodes(data=True) 
-                   if data.get("type") == element_type]
-        
+        elements = index.get(element_type, ())
+
         if not elements:
             return
-        
-        # Count connections to poems
-        element_counts = []
-        for element_id, element_data in elements:
-            poem_connections = sum(1 for neighbor in graph.graph.neighbors(element_id)
-                                 if graph.graph.nodes[neighbor].get("type") == "poem")
-            name = element_data.get("name", element_id)
-            element_counts.append((name, poem_connections))
-        
-        # Sort by connection count
-        element_counts.sort(key=lambda x: x[1], reverse=True)
-        
+
+        # Count connections to poems via the adjacency view: intersecting
+        # the successor keys with the poem-id set keeps the per-element
+        # counting in C, and the comprehension drops the per-element
+        # append call
+        succ = graph.graph.succ
+        element_counts = [
+            (element_data.get("name", element_id), len(succ[element_id].keys() & poem_ids))
+            for element_id, element_data in elements
+        ]
+        
+        # Top 5 by connection count; nlargest does O(N log 5) work
+        # instead of fully sorting the element list
         print(f"\n{title} (Top 5):")
-        for name, count in element_counts[:5]:
+        for name, count in heapq.nlargest(5, element_counts, key=lambda x: x[1]):
             print(f"   • {name}: {count} poem(s)")
     
-    def initialize_from_poems(self, batch_mode: bool = False):
+    def initialize_from_poems(self, batch_mode: bool = False, max_workers: int = 8,
+                              compact: bool = False, verbose: bool = False):
         """Initialize graph from poem files in the poems directory."""
         graph = self.load_or_create_graph()
         analyzer = self.get_analyzer()
@@ -147,112 +269,234 @@ class GraphManager:
             print("📦 Running in BATCH MODE (skip duplicates automatically)")
         print("=" * 60)
         
-        # Look for poem files
-        poem_files = []
-        if self.poems_dir.exists():
-            poem_files.extend(self.poems_dir.glob("*.txt"))
-            poem_files.extend(self.poems_dir.glob("*.md"))
-            poem_files.extend(self.poems_dir.glob("*.json"))
-        
-        if not poem_files:
+        if not self.poems_dir.exists():
             print(f"❌ No poem files found in {self.poems_dir}")
             print("   Create .txt, .md, or .json files with your poems")
             return
-        
-        print(f"📂 Found {len(poem_files)} poem files")
-        
-        for poem_file in poem_files:
+
+        # Counting up front costs a full directory pass, so it's opt-in;
+        # normally the files stream straight into processing and the
+        # first poem is parsed before discovery finishes
+        if verbose:
+            print(f"📂 Found {sum(1 for _ in self._iter_poem_files())} poem files")
+
+        # Parse every file up front so the analysis calls can be issued
+        # concurrently below. A bounded prefetch thread keeps the next
+        # file's read in flight while the current payload is parsed.
+        # Per-suffix parser dispatch is one dict lookup instead of a
+        # Path.suffix computation and branch per file
+        handlers = {
+            ".json": self._parse_json_poem,
+            ".txt": self._parse_text_poem,
+            ".md": self._parse_text_poem,
+        }
+        files_q: "queue.Queue" = queue.Queue(maxsize=2)
+        producer = threading.Thread(
+            target=self._prefetch_poem_files, args=(self._iter_poem_files(), files_q),
+            daemon=True
+        )
+        producer.start()
+
+        parsed = []
+        seen = 0
+        while True:
+            item = files_q.get()
+            if item is None:
+                break
+            seen += 1
+            poem_file, payload = item
             print(f"\n📜 Processing: {poem_file.name}")
-            
+
+            if isinstance(payload, Exception):
+                print(f"   ❌ Error processing {poem_file.name}: {payload}")
+                continue
+
             try:
-                if poem_file.suffix == ".json":
-                    self._process_json_poem(poem_file, graph, analyzer, batch_mode)
-                else:
-                    self._process_text_poem(poem_file, graph, analyzer, batch_mode)
+                suffix = os.path.splitext(poem_file.name)[1].lower()
+                item = handlers[suffix](poem_file, payload)
             except Exception as e:
                 print(f"   ❌ Error processing {poem_file.name}: {e}")
-        
-        # Save the graph
+                continue
+
+            if item is not None:
+                parsed.append(item)
+
+        producer.join()
+
+        if not seen:
+            print(f"❌ No poem files found in {self.poems_dir}")
+            print("   Create .txt, .md, or .json files with your poems")
+            return
+
+        # Resolve duplicates before anything is submitted for analysis:
+        # re-running on an unchanged poems directory must not pay an
+        # analyzer call per already-present poem
+        parsed = self._resolve_duplicates(parsed, graph, batch_mode)
+
+        # Collect analyzed poems and commit them in one bulk graph
+        # mutation after the analysis phase, rather than a node/edge
+        # insert per element per poem
+        pending: List[Dict[str, Any]] = []
+
+        # analyze_poem is a network call and dominates initialization
+        # time; a thread pool overlaps the requests so total latency
+        # approaches that of the slowest call rather than the sum
+        if parsed:
+            # One timestamp for the whole batch - the run happens at
+            # roughly one instant, and this skips a formatting call per poem
+            batch_ts = datetime.now().isoformat()
+            print(f"\n🔍 Analyzing {len(parsed)} poem(s) with {max_workers} workers")
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(analyzer.analyze_poem, text): (poem_id, title, text, route_id)
+                    for poem_id, title, text, route_id in parsed
+                }
+                for future in as_completed(futures):
+                    poem_id, title, text, route_id = futures[future]
+                    try:
+                        analysis = future.result()
+                        analysis_error = None
+                    except Exception as e:
+                        analysis = None
+                        analysis_error = e
+                    self._add_poem_to_graph(
+                        poem_id, title, text, route_id, graph, analyzer,
+                        pending, analysis=analysis, analysis_error=analysis_error,
+                        created_at=batch_ts,
+                    )
+
+        if pending:
+            print(f"\n📦 Committing {len(pending)} poem(s) to the graph")
+            graph.add_poems_bulk(pending)
+
+        # Save the graph: append only this run's poems as a delta unless
+        # a full rewrite was requested
         print(f"\n💾 Saving graph to {self.graph_path}")
-        graph.save_graph()
+        if compact:
+            graph.save_graph()
+        else:
+            graph.save_graph_delta(self._dirty_ids)
+        self._dirty_ids.clear()
+        if self.use_cache:
+            self._refresh_graph_cache()
         print("✅ Graph initialization complete!")
     
-    def _process_json_poem(self, poem_file: Path, graph: ExtendedPoetryGraph, analyzer: PoemAnalyzer, batch_mode: bool = False):
-        """Process a JSON poem file."""
-        with open(poem_file, 'r', encoding='utf-8') as f:
-            poem_data = json.load(f)
-        
+    def _parse_json_poem(self, poem_file: Path, poem_data: Dict[str, Any] = None):
+        """Parse a JSON poem file into a (poem_id, title, text, route_id) tuple."""
+        if poem_data is None:
+            poem_data = _read_poem_payload(poem_file, is_json=True)
+
         poem_id = poem_data.get("id") or poem_file.stem
         title = poem_data.get("title") or poem_file.stem
         text = poem_data.get("text") or poem_data.get("content", "")
         route_id = poem_data.get("route_id", "MANUAL")
-        
+
         if not text:
             print(f"   ⚠️  No text found in {poem_file.name}")
-            return
-        
-        self._add_poem_to_graph(poem_id, title, text, route_id, graph, analyzer, batch_mode)
-    
-    def _process_text_poem(self, poem_file: Path, graph: ExtendedPoetryGraph, analyzer: PoemAnalyzer, batch_mode: bool = False):
-        """Process a text poem file."""
-        with open(poem_file, 'r', encoding='utf-8') as f:
-            content = f.read().strip()
-        
-        # Simple parsing - first line as title if it looks like one
-        lines = content.split('\n')
-        if len(lines) > 1 and len(lines[0]) < 100 and not lines[0].endswith('.'):
-            title = lines[0]
-            text = '\n'.join(lines[1:]).strip()
+            return None
+
+        return poem_id, title, text, route_id
+
+    def _parse_text_poem(self, poem_file: Path, content: str = None):
+        """Parse a text poem file into a (poem_id, title, text, route_id) tuple."""
+        if content is None:
+            content = _read_poem_payload(poem_file, is_json=False)
+        content = content.strip()
+
+        # Simple parsing - first line as title if it looks like one.
+        # partition splits off just the first line instead of building a
+        # list of every line
+        first, sep, rest = content.partition('\n')
+        if sep and len(first) < 100 and not first.endswith('.'):
+            title = first
+            text = rest.strip()
         else:
             title = poem_file.stem
             text = content
-        
+
         poem_id = poem_file.stem
         route_id = "MANUAL"
-        
-        self._add_poem_to_graph(poem_id, title, text, route_id, graph, analyzer, batch_mode)
-    
-    def _add_poem_to_graph(self, poem_id: str, title: str, text: str, route_id: str, 
-                          graph: ExtendedPoetryGraph, analyzer: PoemAnalyzer, batch_mode: bool = False):
-        """Add a poem to the graph with analysis."""
-        
-        # Check if poem already exists
-        if graph.graph.has_node(poem_id):
-            existing_data = graph.graph.nodes[poem_id]
-            if existing_data.get("type") == "poem":
+
+        return poem_id, title, text, route_id
+
+    def _resolve_duplicates(self, parsed: List[tuple], graph: ExtendedPoetryGraph,
+                            batch_mode: bool) -> List[tuple]:
+        """Filter parsed poems against existing ids before analysis.
+
+        Runs before anything reaches the analyzer pool, so poems the
+        graph already holds cost nothing to skip. Repeated ids within
+        one run are dropped too — pending poems are not graph nodes
+        yet, so a later has_node check would let the second copy
+        through and double-count its entities.
+        """
+        resolved = []
+        seen_ids = set()
+        for poem_id, title, text, route_id in parsed:
+            if graph.graph.has_node(poem_id) and graph.graph.nodes[poem_id].get("type") == "poem":
+                if batch_mode:
+                    print(f"   ⏭️  Skipped existing poem (batch mode): {title}")
+                    continue
+
+                existing_data = graph.graph.nodes[poem_id]
                 print(f"   ⚠️  Poem already exists: {title}")
                 print(f"       ID: {poem_id}")
                 print(f"       Existing title: {existing_data.get('title', 'Untitled')}")
-                
-                if batch_mode:
-                    print(f"   ⏭️  Skipped existing poem (batch mode): {title}")
-                    return
-                
-                # Ask user what to do
+
+                # Ask user what to do; the dispatch table folds the
+                # response aliases into one lookup with skip as default
                 try:
                     response = input("       Action: (s)kip, (o)verwrite, (r)ename? [s]: ").lower().strip()
-                    
-                    if response == 'o' or response == 'overwrite':
-                        print(f"   🔄 Overwriting existing poem: {title}")
-                    elif response == 'r' or response == 'rename':
-                        # Generate new ID with timestamp
-                        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                        original_id = poem_id
-                        poem_id = f"{poem_id}_{timestamp}"
-                        print(f"   📝 Renamed: {original_id} → {poem_id}")
-                    else:
-                        print(f"   ⏭️  Skipped existing poem: {title}")
-                        return
                 except (EOFError, KeyboardInterrupt):
+                    response = ''
+
+                action = _DUP_ACTIONS.get(response, 'skip')
+                if action == 'skip':
                     print(f"   ⏭️  Skipped existing poem: {title}")
-                    return
-        
-        print(f"   🔍 Analyzing poem: {title}")
-        
-        # Analyze the poem
-        try:
-            analysis = analyzer.analyze_poem(text)
-            
+                    continue
+                if action == 'rename':
+                    # Generate new ID with timestamp
+                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                    original_id = poem_id
+                    poem_id = f"{poem_id}_{timestamp}"
+                    print(f"   📝 Renamed: {original_id} → {poem_id}")
+                else:
+                    print(f"   🔄 Overwriting existing poem: {title}")
+
+            if poem_id in seen_ids:
+                print(f"   ⏭️  Skipped duplicate id within this run: {title} ({poem_id})")
+                continue
+            seen_ids.add(poem_id)
+            resolved.append((poem_id, title, text, route_id))
+
+        return resolved
+
+    def _add_poem_to_graph(self, poem_id: str, title: str, text: str, route_id: str,
+                          graph: ExtendedPoetryGraph, analyzer: PoemAnalyzer,
+                          pending: List[Dict[str, Any]] = None,
+                          analysis: Dict[str, Any] = None, analysis_error: Exception = None,
+                          created_at: str = None):
+        """Add a poem to the graph with analysis (no duplicate handling).
+
+        When a pending list is supplied the prepared poem is appended to
+        it for a later add_poems_bulk call instead of being written to
+        the graph immediately; interactive addition still mutates in
+        place. An already-computed analysis (or the error it raised) can
+        be passed in so concurrent callers skip the inline analyzer call.
+        """
+        # Determine narrative role - manual poems are likely core narrative
+        narrative_role = _ROLE_CACHE.get(route_id, "route_generated")
+        if created_at is None:
+            created_at = datetime.now().isoformat()
+
+        # Analyze the poem unless a result (or failure) was handed in
+        if analysis is None and analysis_error is None:
+            print(f"   🔍 Analyzing poem: {title}")
+            try:
+                analysis = analyzer.analyze_poem(text)
+            except Exception as e:
+                analysis_error = e
+
+        if analysis_error is None:
             # Extract elements
             themes = analysis.get("themes", [])
             imagery = analysis.get("imagery", [])
@@ -260,12 +504,8 @@ class GraphManager:
             sound_devices = analysis.get("sound_devices", [])
             structure_metadata = analysis.get("structure", {})
             sound_metadata = analysis.get("sound_patterns", {})
-            
-            # Determine narrative role - manual poems are likely core narrative
-            narrative_role = "core" if route_id == "MANUAL" else "route_generated"
-            
-            # Add to graph
-            graph.add_poem(
+
+            poem_spec = dict(
                 poem_id=poem_id,
                 title=title,
                 text=text,
@@ -278,30 +518,40 @@ class GraphManager:
                 sound_metadata=sound_metadata,
                 narrative_role=narrative_role,
                 metadata={
-                    "created_at": datetime.now().isoformat(),
+                    "created_at": created_at,
                     "source": "manual",
                 }
             )
-            
+
+            if pending is not None:
+                pending.append(poem_spec)
+            else:
+                graph.add_poem(**poem_spec)
+            self._dirty_ids.add(poem_id)
+
             print(f"   ✅ Added: {len(themes)} themes, {len(imagery)} imagery, "
                   f"{len(emotions)} emotions, {len(sound_devices)} sound devices")
-        
-        except Exception as e:
-            print(f"   ❌ Analysis failed: {e}")
-            # Add poem without analysis - manual poems are likely core narrative
-            narrative_role = "core" if route_id == "MANUAL" else "route_generated"
-            graph.add_poem(
+
+        else:
+            print(f"   ❌ Analysis failed: {analysis_error}")
+            # Add poem without analysis
+            poem_spec = dict(
                 poem_id=poem_id,
                 title=title,
                 text=text,
                 route_id=route_id,
                 narrative_role=narrative_role,
                 metadata={
-                    "created_at": datetime.now().isoformat(),
+                    "created_at": created_at,
                     "source": "manual",
-                    "analysis_failed": str(e)
+                    "analysis_failed": str(analysis_error)
                 }
             )
+            if pending is not None:
+                pending.append(poem_spec)
+            else:
+                graph.add_poem(**poem_spec)
+            self._dirty_ids.add(poem_id)
             print(f"   ⚠️  Added poem without analysis")
     
     def add_poem_interactive(self):
@@ -351,6 +601,8 @@ class GraphManager:
         # Save the graph
         print(f"\n💾 Saving graph...")
         graph.save_graph()
+        if self.use_cache:
+            self._refresh_graph_cache()
         print("✅ Poem added successfully!")
     
     def analyze_deep(self):
@@ -362,35 +614,40 @@ class GraphManager:
         print("=" * 60)
         
         # Get all poems
-        poems = [(node_id, data) for node_id, data in graph.graph.nodes(data=True) 
-                if data.get("type") == "poem"]
-        
+        poems = self._index_nodes_by_type(graph).get("poem", [])
+
         if not poems:
             print("❌ No poems found for analysis!")
             return
         
-        # Analyze co-occurrences
+        # Analyze co-occurrences — all type pairs in one sweep over poems
         print("\n🔗 Element Co-occurrences:")
-        
-        theme_emotion = graph.get_entity_co_occurrence("theme", "emotion")
+
+        co_occurrences = graph.get_all_co_occurrences()
+
+        theme_emotion = co_occurrences[("theme", "emotion")]
         if theme_emotion:
             print("\n   Theme-Emotion pairs (top 10):")
-            sorted_pairs = sorted(theme_emotion.items(), key=lambda x: x[1], reverse=True)
-            for (theme, emotion), count in sorted_pairs[:10]:
+            top_pairs = heapq.nlargest(10, theme_emotion.items(), key=lambda x: x[1])
+            for (theme, emotion), count in top_pairs:
                 print(f"     • {theme} + {emotion}: {count} times")
         
-        imagery_emotion = graph.get_entity_co_occurrence("imagery", "emotion")
+        imagery_emotion = co_occurrences[("imagery", "emotion")]
         if imagery_emotion:
             print("\n   Imagery-Emotion pairs (top 10):")
-            sorted_pairs = sorted(imagery_emotion.items(), key=lambda x: x[1], reverse=True)
-            for (imagery, emotion), count in sorted_pairs[:10]:
+            top_pairs = heapq.nlargest(10, imagery_emotion.items(), key=lambda x: x[1])
+            for (imagery, emotion), count in top_pairs:
                 print(f"     • {imagery} + {emotion}: {count} times")
         
-        # Analyze poem structures
+        # Analyze poem structures. Line counts go into a typed int array:
+        # a compact C buffer that sum/min/max iterate without per-element
+        # object overhead, unlike a list of boxed ints
         print("\n📐 Structural Analysis:")
-        line_counts = []
-        forms = []
-        
+        line_counts = array('i')
+        # Tally forms while iterating poems instead of collecting a list
+        # and counting it in a second pass
+        form_counts = defaultdict(int)
+
         for poem_id, poem_data in poems:
             metadata = poem_data.get("metadata", {})
             structure = metadata.get("structure", {})
@@ -402,7 +659,7 @@ class GraphManager:
                 if line_count > 0:
                     line_counts.append(line_count)
                 if form != "unknown":
-                    forms.append(form)
+                    form_counts[form] += 1
         
         if line_counts:
             avg_lines = sum(line_counts) / len(line_counts)
@@ -410,11 +667,10 @@ class GraphManager:
             max_lines = max(line_counts)
             print(f"   • Line counts: avg={avg_lines:.1f}, min={min_lines}, max={max_lines}")
         
-        if forms:
-            from collections import Counter
-            form_counts = Counter(forms)
+        if form_counts:
             print("   • Forms used:")
-            for form, count in form_counts.most_common():
+            for form, count in heapq.nlargest(len(form_counts), form_counts.items(),
+                                              key=lambda kv: kv[1]):
                 print(f"     • {form}: {count} poems")
 
 
@@ -424,17 +680,22 @@ def main():
     parser.add_argument("--examine", action="store_true", help="Examine current graph state")
     parser.add_argument("--initialize", action="store_true", help="Initialize graph from poems")
     parser.add_argument("--batch", action="store_true", help="Skip duplicates automatically (use with --initialize)")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent analysis calls (use with --initialize)")
+    parser.add_argument("--compact", action="store_true", help="Rewrite the full graph file instead of appending a delta (use with --initialize)")
+    parser.add_argument("--no-cache", action="store_true", help="Skip the pickle sidecar and load the graph from JSON")
+    parser.add_argument("--verbose", action="store_true", help="Count poem files up front before processing (use with --initialize)")
     parser.add_argument("--add-poem", action="store_true", help="Add a poem interactively")
     parser.add_argument("--analyze", action="store_true", help="Perform deep analysis")
     
     args = parser.parse_args()
     
-    manager = GraphManager()
-    
+    manager = GraphManager(use_cache=not args.no_cache)
+
     if args.examine:
         manager.examine_graph()
     elif args.initialize:
-        manager.initialize_from_poems(batch_mode=args.batch)
+        manager.initialize_from_poems(batch_mode=args.batch, max_workers=args.workers,
+                                      compact=args.compact, verbose=args.verbose)
     elif args.add_poem:
         manager.add_poem_interactive()
     elif args.analyze:
@@ -8,6 +8,7 @@ This script helps you designate and manage core narrative poems vs route-generat
 import sys
 import os
 import argparse
+from collections import defaultdict
 from pathlib import Path
 from typing import Dict, Any, List
 from datetime import datetime
@@ -26,15 +27,85 @@ class NarrativeManager:
         """Initialize the narrative manager."""
         self.graph_path = backend_dir / "data" / "poetry_graph.json"
         self.graph = None
-    
+        # Lazy poem caches: every menu action wants the same filtered
+        # poem list, so one node scan serves them all until a mutation
+        # invalidates it
+        self._poems_list = None
+        self._poems_by_id = None
+        self._poems_by_title = None
+        self._poems_by_role = None
+
     def load_graph(self) -> ExtendedPoetryGraph:
-        """Load the graph."""
+        """Load the graph, preferring the pickle sidecar when fresh."""
         if self.graph is None:
             if not self.graph_path.exists():
                 raise FileNotFoundError(f"Graph file not found: {self.graph_path}")
-            self.graph = ExtendedPoetryGraph(str(self.graph_path))
+            self.graph = ExtendedPoetryGraph.load_cached(str(self.graph_path))
+            if self.graph is None:
+                self.graph = ExtendedPoetryGraph(str(self.graph_path))
+                self.graph.refresh_cache()
         return self.graph
-    
+
+    def _save_changes(self, changed_ids: List[str] = None):
+        """Persist a mutation, journaling just the changed poems when possible.
+
+        Role marks and connection edits touch a handful of nodes, so
+        appending their delta records writes O(changed) bytes instead of
+        re-serializing the whole graph. Removals pass no ids and fall
+        back to a full save, since the journal cannot express deletions.
+        Either way the poem caches are dropped and the pickle sidecar is
+        refreshed so the next invocation stays warm.
+        """
+        self._invalidate_poem_cache()
+        if changed_ids:
+            self.graph.save_graph_delta(set(changed_ids))
+        else:
+            self.graph.save_graph()
+        self.graph.refresh_cache()
+
+    def compact_graph(self):
+        """Fuse the delta journal back into the base graph file."""
+        graph = self.load_graph()
+        graph.save_graph()
+        graph.refresh_cache()
+        print(f"💾 Compacted graph to {self.graph_path}")
+
+    def _refresh_poem_cache(self):
+        """Walk the node set once and build the poem indexes."""
+        graph = self.load_graph()
+        poems_list = []
+        by_id = {}
+        by_title = {}
+        by_role = defaultdict(list)
+        for node_id, data in graph.graph.nodes(data=True):
+            if data.get("type") != "poem":
+                continue
+            poems_list.append((node_id, data))
+            by_id[node_id] = data
+            # First-wins on duplicate titles, matching the old linear
+            # scan that broke at the first match; untitled poems are
+            # not indexed rather than collapsing onto one key
+            title = data.get("title")
+            if title is not None:
+                by_title.setdefault(title, node_id)
+            by_role[data.get("narrative_role", "unassigned")].append((node_id, data))
+        self._poems_list = poems_list
+        self._poems_by_id = by_id
+        self._poems_by_title = by_title
+        self._poems_by_role = by_role
+
+    def _ensure_poem_cache(self):
+        """Populate the poem caches if a mutation (or nothing yet) invalidated them."""
+        if self._poems_list is None:
+            self._refresh_poem_cache()
+
+    def _invalidate_poem_cache(self):
+        """Drop the poem caches after a graph mutation."""
+        self._poems_list = None
+        self._poems_by_id = None
+        self._poems_by_title = None
+        self._poems_by_role = None
+
     def show_narrative_status(self):
         """Show current narrative structure."""
         graph = self.load_graph()
@@ -62,20 +133,12 @@ class NarrativeManager:
             latest = summary['latest_core_poem']
             print(f"\n📅 Latest Core Poem: {latest.get('title', 'Untitled')}")
         
-        # Show all poems by narrative role
+        # Show all poems by narrative role, straight from the role cache
         print(f"\n📚 All Poems by Narrative Role:")
-        
-        all_poems = [(node_id, data) for node_id, data in graph.graph.nodes(data=True) 
-                    if data.get("type") == "poem"]
-        
-        # Group by narrative role
-        by_role = {}
-        for poem_id, poem_data in all_poems:
-            role = poem_data.get("narrative_role", "unassigned")
-            if role not in by_role:
-                by_role[role] = []
-            by_role[role].append((poem_id, poem_data))
-        
+
+        self._ensure_poem_cache()
+        by_role = self._poems_by_role
+
         role_order = ["core", "extension", "variation", "route_generated", "unassigned"]
         role_icons = {
             "core": "🎯",
@@ -105,31 +168,31 @@ class NarrativeManager:
         print("🎯 MARKING POEMS AS CORE NARRATIVE")
         print("-" * 40)
         
-        success_count = 0
+        changed_ids = []
         for poem_id in poem_ids:
             if graph.mark_poem_as_core(poem_id):
                 poem_data = graph.graph.nodes[poem_id]
                 title = poem_data.get("title", "Untitled")
                 print(f"✅ Marked as core: {title}")
-                success_count += 1
+                changed_ids.append(poem_id)
             else:
                 print(f"❌ Failed to mark: {poem_id} (not found)")
-        
-        if success_count > 0:
-            graph.save_graph()
-            print(f"\n💾 Saved {success_count} changes to graph")
-    
+
+        if changed_ids:
+            self._save_changes(changed_ids)
+            print(f"\n💾 Saved {len(changed_ids)} changes to graph")
+
     def mark_poems_as_core_interactive(self):
         """Interactive interface to mark poems as core narrative."""
         graph = self.load_graph()
         
         print("🎯 MARK POEMS AS CORE NARRATIVE")
         print("-" * 40)
-        
+
         # Show available poems
-        all_poems = [(node_id, data) for node_id, data in graph.graph.nodes(data=True) 
-                    if data.get("type") == "poem"]
-        
+        self._ensure_poem_cache()
+        all_poems = self._poems_list
+
         if not all_poems:
             print("❌ No poems found in graph")
             return
@@ -184,11 +247,11 @@ class NarrativeManager:
         
         print("🔗 MARK POEMS AS NARRATIVE EXTENSIONS")
         print("-" * 40)
-        
+
         # Show available poems
-        all_poems = [(node_id, data) for node_id, data in graph.graph.nodes(data=True) 
-                    if data.get("type") == "poem"]
-        
+        self._ensure_poem_cache()
+        all_poems = self._poems_list
+
         if not all_poems:
             print("❌ No poems found in graph")
             return
@@ -240,31 +303,31 @@ class NarrativeManager:
         print("🔗 MARKING POEMS AS NARRATIVE EXTENSIONS")
         print("-" * 40)
         
-        success_count = 0
+        changed_ids = []
         for poem_id in poem_ids:
             if graph.mark_poem_as_extension(poem_id):
                 poem_data = graph.graph.nodes[poem_id]
                 title = poem_data.get("title", "Untitled")
                 print(f"✅ Marked as extension: {title}")
-                success_count += 1
+                changed_ids.append(poem_id)
             else:
                 print(f"❌ Failed to mark: {poem_id} (not found)")
-        
-        if success_count > 0:
-            graph.save_graph()
-            print(f"\n💾 Saved {success_count} changes to graph")
-    
+
+        if changed_ids:
+            self._save_changes(changed_ids)
+            print(f"\n💾 Saved {len(changed_ids)} changes to graph")
+
     def create_narrative_connections(self):
         """Interactively create connections between poems."""
         graph = self.load_graph()
         
         print("🔗 CREATE NARRATIVE CONNECTIONS")
         print("-" * 40)
-        
+
         # Show available poems
-        all_poems = [(node_id, data) for node_id, data in graph.graph.nodes(data=True) 
-                    if data.get("type") == "poem"]
-        
+        self._ensure_poem_cache()
+        all_poems = self._poems_list
+
         print("Available poems:")
         for i, (poem_id, poem_data) in enumerate(all_poems, 1):
             title = poem_data.get("title", "Untitled")[:40]
@@ -305,7 +368,7 @@ class NarrativeManager:
             
             if graph.create_narrative_connection(source_id, target_id, connection_type, strength, notes):
                 print(f"✅ Created connection: {source_id} → {target_id}")
-                graph.save_graph()
+                self._save_changes([source_id])
                 print("💾 Saved changes")
             else:
                 print("❌ Failed to create connection")
@@ -328,18 +391,17 @@ class NarrativeManager:
             print("❌ No route-generated poems found")
             return
         
+        # get_route_generated_poems returns attribute dicts without the node
+        # id, so map titles back to ids once instead of rescanning the node
+        # set for every poem
+        self._ensure_poem_cache()
+        title_to_id = self._poems_by_title
+
         print("Route-generated poems:")
         for i, poem in enumerate(route_poems, 1):
             title = poem.get("title", "Untitled")[:50]
             route_id = poem.get("route_id", "Unknown")
-            poem_id = None
-            # Find the poem ID
-            for node_id, node_data in graph.graph.nodes(data=True):
-                if (node_data.get("type") == "poem" and 
-                    node_data.get("title") == poem.get("title")):
-                    poem_id = node_id
-                    break
-            
+            poem_id = title_to_id.get(poem.get("title"))
             print(f"  {i:2}. [{poem_id}] {title} (Route: {route_id})")
         
         try:
@@ -349,26 +411,19 @@ class NarrativeManager:
                 return
             
             selected_indices = [int(x.strip()) - 1 for x in selections.split(",")]
-            
-            success_count = 0
+
+            changed_ids = []
             for idx in selected_indices:
                 if 0 <= idx < len(route_poems):
                     poem = route_poems[idx]
-                    # Find poem ID
-                    poem_id = None
-                    for node_id, node_data in graph.graph.nodes(data=True):
-                        if (node_data.get("type") == "poem" and 
-                            node_data.get("title") == poem.get("title")):
-                            poem_id = node_id
-                            break
-                    
+                    poem_id = title_to_id.get(poem.get("title"))
                     if poem_id and graph.mark_poem_as_extension(poem_id):
                         print(f"✅ Converted: {poem.get('title', 'Untitled')}")
-                        success_count += 1
-            
-            if success_count > 0:
-                graph.save_graph()
-                print(f"\\n💾 Converted {success_count} poems to extensions")
+                        changed_ids.append(poem_id)
+
+            if changed_ids:
+                self._save_changes(changed_ids)
+                print(f"\\n💾 Converted {len(changed_ids)} poems to extensions")
         
         except (ValueError, EOFError) as e:
             print(f"❌ Invalid input: {e}")
@@ -379,11 +434,11 @@ class NarrativeManager:
         
         print("🗑️  REMOVE POEMS FROM GRAPH")
         print("-" * 40)
-        
+
         # Show available poems
-        all_poems = [(node_id, data) for node_id, data in graph.graph.nodes(data=True) 
-                    if data.get("type") == "poem"]
-        
+        self._ensure_poem_cache()
+        all_poems = self._poems_list
+
         if not all_poems:
             print("❌ No poems found in graph")
             return
@@ -440,7 +495,7 @@ class NarrativeManager:
                     print(f"❌ Failed to remove: {title}")
             
             if removed_count > 0:
-                graph.save_graph()
+                self._save_changes()
                 print(f"\\n💾 Removed {removed_count} poems from graph")
         
         except (ValueError, EOFError) as e:
@@ -454,11 +509,11 @@ class NarrativeManager:
         print("-" * 40)
         
         # Show poems with assigned roles
-        assigned_poems = [(node_id, data) for node_id, data in graph.graph.nodes(data=True) 
-                         if (data.get("type") == "poem" and 
-                             data.get("narrative_role") and 
-                             data.get("narrative_role") != "unassigned")]
-        
+        self._ensure_poem_cache()
+        assigned_poems = [(poem_id, data) for poem_id, data in self._poems_list
+                          if data.get("narrative_role") and
+                          data.get("narrative_role") != "unassigned"]
+
         if not assigned_poems:
             print("❌ No poems with assigned narrative roles found")
             return
@@ -477,21 +532,21 @@ class NarrativeManager:
             
             selected_indices = [int(x.strip()) - 1 for x in selections.split(",")]
             
-            success_count = 0
+            changed_ids = []
             for idx in selected_indices:
                 if 0 <= idx < len(assigned_poems):
                     poem_id, poem_data = assigned_poems[idx]
                     title = poem_data.get("title", "Untitled")
-                    
+
                     if graph.clear_narrative_role(poem_id):
                         print(f"✅ Cleared role: {title}")
-                        success_count += 1
+                        changed_ids.append(poem_id)
                     else:
                         print(f"❌ Failed to clear: {title}")
-            
-            if success_count > 0:
-                graph.save_graph()
-                print(f"\\n💾 Cleared {success_count} narrative roles")
+
+            if changed_ids:
+                self._save_changes(changed_ids)
+                print(f"\\n💾 Cleared {len(changed_ids)} narrative roles")
         
         except (ValueError, EOFError) as e:
             print(f"❌ Invalid input: {e}")
@@ -529,20 +584,22 @@ class NarrativeManager:
             
             selected_indices = [int(x.strip()) - 1 for x in selections.split(",")]
             
-            removed_count = 0
+            changed_ids = []
             for idx in selected_indices:
                 if 0 <= idx < len(connections):
                     source_id, target_id, source_title, target_title, conn_type = connections[idx]
-                    
+
                     if graph.remove_narrative_connection(source_id, target_id):
                         print(f"✅ Removed connection: {source_title[:30]} → {target_title[:30]}")
-                        removed_count += 1
+                        changed_ids.append(source_id)
                     else:
                         print(f"❌ Failed to remove: {source_title[:30]} → {target_title[:30]}")
-            
-            if removed_count > 0:
-                graph.save_graph()
-                print(f"\\n💾 Removed {removed_count} narrative connections")
+
+            if changed_ids:
+                # A source poem's delta record re-states its current edge
+                # set, so replaying it drops the removed connection
+                self._save_changes(changed_ids)
+                print(f"\\n💾 Removed {len(changed_ids)} narrative connections")
         
         except (ValueError, EOFError) as e:
             print(f"❌ Invalid input: {e}")
@@ -554,13 +611,10 @@ class NarrativeManager:
         print("🎯❌ REMOVE POEMS BY NARRATIVE ROLE")
         print("-" * 40)
         
-        # Count poems by role
-        role_counts = {}
-        for node_id, node_data in graph.graph.nodes(data=True):
-            if node_data.get("type") == "poem":
-                role = node_data.get("narrative_role", "unassigned")
-                role_counts[role] = role_counts.get(role, 0) + 1
-        
+        # Count poems by role from the cached index
+        self._ensure_poem_cache()
+        role_counts = {role: len(poems) for role, poems in self._poems_by_role.items()}
+
         if not role_counts:
             print("❌ No poems found")
             return
@@ -593,11 +647,15 @@ class NarrativeManager:
             
             confirm_each = input("\\nConfirm each removal individually? (y/n) [n]: ").lower().strip()
             callback = confirm_each_removal if confirm_each == 'y' else None
-            
-            removed_count = graph.remove_poems_by_narrative_role(role_to_remove, callback)
+
+            # The role cache already holds the target set, so hand the
+            # ids straight to the graph instead of having it re-derive
+            # them from the role
+            poem_ids = [pid for pid, _ in self._poems_by_role.get(role_to_remove, ())]
+            removed_count = graph.remove_poems_by_ids(poem_ids, callback)
             
             if removed_count > 0:
-                graph.save_graph()
+                self._save_changes()
                 print(f"\\n💾 Removed {removed_count} poems with role '{role_to_remove}'")
             else:
                 print("❌ No poems were removed")
@@ -673,7 +731,9 @@ def main():
     parser.add_argument("--clear-role", help="Clear narrative role for specific poem by ID")
     parser.add_argument("--remove-role", help="Remove all poems with specific narrative role")
     parser.add_argument("--export-report", help="Export narrative report to file")
-    
+    parser.add_argument("--compact", action="store_true",
+                        help="Fuse the delta journal back into the graph file")
+
     args = parser.parse_args()
     
     manager = NarrativeManager()
@@ -688,26 +748,28 @@ def main():
         elif args.remove_poem:
             graph = manager.load_graph()
             if graph.remove_poem(args.remove_poem):
-                graph.save_graph()
+                manager._save_changes()
                 print(f"✅ Removed poem: {args.remove_poem}")
             else:
                 print(f"❌ Failed to remove poem: {args.remove_poem}")
         elif args.clear_role:
             graph = manager.load_graph()
             if graph.clear_narrative_role(args.clear_role):
-                graph.save_graph()
+                manager._save_changes([args.clear_role])
                 print(f"✅ Cleared narrative role for: {args.clear_role}")
             else:
                 print(f"❌ Failed to clear role for: {args.clear_role}")
         elif args.remove_role:
             graph = manager.load_graph()
             removed_count = graph.remove_poems_by_narrative_role(args.remove_role)
-            graph.save_graph()
+            manager._save_changes()
             print(f"✅ Removed {removed_count} poems with role '{args.remove_role}'")
         elif args.export_report:
             graph = manager.load_graph()
             graph.export_narrative_report(args.export_report)
             print(f"✅ Exported narrative report to: {args.export_report}")
+        elif args.compact:
+            manager.compact_graph()
         elif args.interactive:
             manager.interactive_menu()
         else:
@@ -721,6 +783,7 @@ def main():
             print("  --clear-role POEM_ID            Clear narrative role for poem")
             print("  --remove-role ROLE              Remove all poems with role")
             print("  --export-report FILE            Export narrative report")
+            print("  --compact                       Fuse delta journal into graph file")
             print("  --interactive                   Interactive menu")
     
     except Exception as e:
@@ -101,7 +101,7 @@ def show_overview():
     for dir_name, description in output_dirs:
         dir_path = backend_dir / dir_name
         if dir_path.exists():
-            file_count = len(list(dir_path.glob("*")))
+            file_count = sum(1 for _ in dir_path.glob("*"))
             print(f"✅ {dir_name:<12} {description} ({file_count} files)")
         else:
             print(f"📁 {dir_name:<12} {description} (create as needed)")